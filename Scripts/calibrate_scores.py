@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Score-distribution and star-threshold calibrator for Starship Lander.
+
+Mirrors GameScene.calculateScore as a vectorized NumPy function that scores
+millions of touchdowns (vertical, horizontal, rotation, approach, offset,
+fuel, platform) at once. The term weights, landing thresholds and platform
+widths/multipliers are read from the Swift sources; reference vectors whose
+scores were worked out from the Swift formula guard the mirror against drift.
+
+Touchdowns come from the landability simulator (run on the fly, or loaded
+from `simulate_landings.py --save`), or from a synthetic uniform draw over
+the safe-landing envelope. For each level it reports the score distribution,
+suggested 1/2/3-star cutoffs (score percentiles of successful landings) and a
+suggested seeded default score to replace the hand-picked 1000 in
+CampaignState.seedDefaultScoresIfNeeded.
+
+Usage:
+    python3 calibrate_scores.py                      # Simulate all levels, print cutoffs
+    python3 calibrate_scores.py --runs runs.npz      # Use saved simulate_landings.py data
+    python3 calibrate_scores.py --synthetic 5000000  # Level-independent formula distribution
+    python3 calibrate_scores.py --percentiles 40 75 95 --swift
+    python3 calibrate_scores.py --check              # Verify against reference vectors only
+"""
+
+import re
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    print("Installing NumPy...")
+    import subprocess
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "numpy", "-q"])
+    import numpy as np
+
+from simulate_landings import SWIFT_DIR, SCREEN, LANDED, load_levels, load_thresholds, load_platforms, sweep
+
+# calculateScore term -> the GameScene threshold its ratio is taken against.
+# The center term is special-cased: its limit is the platform's half width.
+SCORE_TERMS = {
+    "softLanding": "maxSafeVerticalSpeed",
+    "horizontal": "maxSafeHorizontalSpeed",
+    "center": None,
+    "rotation": "maxSafeRotation",
+    "approach": "maxSafeApproachSpeed",
+}
+SAMPLE_FIELDS = ("vertical", "horizontal", "rotation", "approach", "offset", "fuel", "platform")
+
+# (vertical, horizontal, rotation, approach, offset, fuel, platform index) -> Int score,
+# worked out by hand from GameScene+Scoring.swift (exact arithmetic, then Int() truncation)
+REFERENCE_VECTORS = [
+    ((0.0, 0.0, 0.0, 0.0, 0.0, 100.0, 2), 20000),      # perfect landing on C, full tank
+    ((40.0, 25.0, 0.05, 80.0, 40.0, 0.0, 0), 188),     # every ratio at its limit but the offset
+    ((60.0, 30.0, 0.2, 120.0, 90.0, 0.0, 1), 200),     # ratios clamp at 1 -> base 100 x B
+    ((12.5, 3.2, 0.01, 20.0, 8.0, 47.3, 0), 1983),
+    ((20.0, 10.0, 0.025, 40.0, 27.5, 62.5, 1), 2011),
+    ((35.7, 18.1, 0.049, 71.2, 30.4, 12.9, 2), 975),
+    ((5.25, 1.75, 0.004, 9.5, 3.0, 88.8, 2), 15715),
+    ((28.0, 22.0, 0.03, 66.0, 50.0, 0.3, 1), 401),
+    ((0.0, 0.0, 0.0, 0.0, 65.0, 100.0, 0), 2800),      # edge of A: center term is 0
+    ((17.3, 6.4, 0.012, 31.8, 14.6, 35.55, 2), 6257),
+]
+
+DEFAULT_PERCENTILES = (50, 80, 95)
+CUTOFF_ROUNDING = 50
+
+
+def load_score_weights(swift_dir: Path = SWIFT_DIR) -> dict:
+    """Base subtotal and per-term weights from calculateScore, e.g. {"base": 100.0, "softLanding": 500.0, ...}."""
+    text = (swift_dir / "GameScene+Scoring.swift").read_text()
+    weights = {"base": float(re.search(r"var subtotal: Double = ([\d.]+)", text)[1])}
+    for m in re.finditer(r"let (\w+)Score = ([\d.]+) \* pow\(1\.0 - \w+Ratio, 2\)", text):
+        weights[m[1]] = float(m[2])
+    missing = set(SCORE_TERMS) - set(weights)
+    if missing:
+        sys.exit(f"calculateScore terms not found in GameScene+Scoring.swift: {', '.join(sorted(missing))}")
+    return weights
+
+
+def load_seed_score(swift_dir: Path = SWIFT_DIR) -> int:
+    """Score given to the seeded high-score entries in CampaignState.seedDefaultScoresIfNeeded."""
+    text = (swift_dir / "Models" / "CampaignState.swift").read_text()
+    return int(re.search(r"HighScoreEntry\(name: name, score: (\d+)\)", text)[1])
+
+
+def calculate_scores(samples: dict, weights: dict, thresholds: dict, platforms: dict) -> np.ndarray:
+    """Vectorized GameScene.calculateScore over arrays of touchdowns; returns int64 scores.
+
+    Follows the Swift evaluation order (terms summed in source order, then
+    x fuel multiplier x platform multiplier, truncated like Int()).
+    """
+    platform = np.asarray(samples["platform"], dtype=np.intp)
+    inputs = {
+        "softLanding": samples["vertical"],
+        "horizontal": samples["horizontal"],
+        "center": samples["offset"],
+        "rotation": samples["rotation"],
+        "approach": samples["approach"],
+    }
+    subtotal = np.full(len(platform), weights["base"])
+    for term, limit_name in SCORE_TERMS.items():
+        limit = platforms["width"][platform] / 2 if limit_name is None else thresholds[limit_name]
+        ratio = np.minimum(1.0, np.asarray(inputs[term], dtype=float) / limit)
+        subtotal += weights[term] * (1.0 - ratio) ** 2
+    fuel_multiplier = 1.0 + (np.asarray(samples["fuel"], dtype=float) / 100.0) * 1.0
+    return np.trunc(subtotal * fuel_multiplier * platforms["multiplier"][platform]).astype(np.int64)
+
+
+def load_reference(path: Path = None) -> list:
+    """Built-in reference vectors, or [{"vertical": ..., ..., "platform": "A", "score": n}, ...] from JSON."""
+    if path is None:
+        return REFERENCE_VECTORS
+    vectors = []
+    for entry in json.loads(path.read_text()):
+        platform = entry["platform"]
+        if isinstance(platform, str):
+            platform = "ABC".index(platform.upper())
+        inputs = tuple(float(entry[field]) for field in SAMPLE_FIELDS[:-1]) + (platform,)
+        vectors.append((inputs, int(entry["score"])))
+    return vectors
+
+
+def check_reference(vectors: list, weights: dict, thresholds: dict, platforms: dict) -> list:
+    """Score the reference vectors; returns [(inputs, expected, got)] for every mismatch."""
+    columns = list(zip(*(inputs for inputs, _ in vectors)))
+    samples = {field: np.array(column) for field, column in zip(SAMPLE_FIELDS, columns)}
+    scores = calculate_scores(samples, weights, thresholds, platforms)
+    return [(inputs, expected, int(got)) for (inputs, expected), got in zip(vectors, scores) if got != expected]
+
+
+def synthetic_samples(rng, n: int, thresholds: dict, platforms: dict) -> dict:
+    """n touchdowns drawn uniformly over the safe-landing envelope and the three platforms."""
+    platform = rng.integers(0, len(platforms["width"]), n)
+    return {
+        "vertical": rng.uniform(0, thresholds["maxSafeVerticalSpeed"], n),
+        "horizontal": rng.uniform(0, thresholds["maxSafeHorizontalSpeed"], n),
+        "rotation": rng.uniform(0, thresholds["maxSafeRotation"], n),
+        "approach": rng.uniform(0, thresholds["maxSafeApproachSpeed"], n),
+        "offset": rng.uniform(0, platforms["width"][platform] / 2),
+        "fuel": rng.uniform(0, 100, n),
+        "platform": platform,
+    }
+
+
+def landed_samples(result: dict) -> dict:
+    """Successful touchdowns from a simulate_landings result (or its saved per-level arrays)."""
+    landed = result["outcome"] == LANDED
+    return {field: result[field][landed] for field in SAMPLE_FIELDS}
+
+
+def load_runs(path: Path, levels: list[dict]) -> dict:
+    """{level id: landed samples} from a `simulate_landings.py --save` archive."""
+    archive = np.load(path)
+    runs = {}
+    for level in levels:
+        key = f"outcome_{level['id']}"
+        if key in archive:
+            runs[level["id"]] = landed_samples({field: archive[f"{field}_{level['id']}"]
+                                                for field in SAMPLE_FIELDS + ("outcome",)})
+    if not runs:
+        sys.exit(f"No per-level data for the selected levels in {path}")
+    return runs
+
+
+def suggest_cutoffs(scores: np.ndarray, percentiles: tuple) -> list[int]:
+    """Star cutoffs at the given score percentiles, rounded down to CUTOFF_ROUNDING."""
+    if not len(scores):
+        return [0] * len(percentiles)
+    cutoffs = np.percentile(scores, percentiles)
+    return [int(value // CUTOFF_ROUNDING * CUTOFF_ROUNDING) for value in cutoffs]
+
+
+def summarize(scores: np.ndarray, platform: np.ndarray, percentiles: tuple, seed_score: int) -> dict:
+    """Distribution, platform-based star shares, suggested cutoffs and seed score for one level."""
+    n = len(scores)
+    return {
+        "n": n,
+        "quantiles": np.percentile(scores, [10, 50, 90]) if n else np.full(3, np.nan),
+        "max": int(scores.max()) if n else 0,
+        "platform_shares": np.bincount(platform, minlength=3) / max(1, n),
+        "cutoffs": suggest_cutoffs(scores, percentiles),
+        "seed": suggest_cutoffs(scores, (50,))[0],
+        "beat_seed": (scores > seed_score).mean() if n else np.nan,
+    }
+
+
+def print_report(rows: list[tuple], percentiles: tuple, seed_score: int):
+    labels = "/".join(f"p{p:g}" for p in percentiles)
+    print(f"{'Level':<12} {'Landed':>7}  {'Score p10/p50/p90':>20} {'Max':>6}  "
+          f"{'Pad A/B/C share':>15}  {'Cutoffs ' + labels:>22}  {'Seed':>5}  Beat {seed_score}")
+    print("-" * 112)
+    for label, summary in rows:
+        p10, p50, p90 = summary["quantiles"]
+        shares = "/".join(f"{share * 100:.0f}" for share in summary["platform_shares"])
+        cutoffs = " / ".join(f"{cutoff:,}" for cutoff in summary["cutoffs"])
+        print(f"{label:<12} {summary['n']:>7,}  {p10:6.0f} {p50:6.0f} {p90:6.0f} {summary['max']:>6}  "
+              f"{shares:>15}  {cutoffs:>22}  {summary['seed']:>5}  {summary['beat_seed'] * 100:5.1f}%")
+
+
+def print_swift(levels: list[dict], summaries: dict, seed_score: int):
+    """Suggested seed scores and star cutoffs as Swift, ready to paste.
+
+    Neither table exists in the app yet: stars come from LandingPlatform.stars
+    and every level is seeded with the same literal score, so both are printed
+    as proposed declarations alongside the seed line that would use them.
+    """
+    summaries = {level_id: summary for level_id, summary in summaries.items() if summary["n"]}
+    print("\n    // Generated by Scripts/calibrate_scores.py")
+    print("    // Proposed CampaignState declaration (new): per-level seed scores")
+    print("    static let defaultScores: [Int: Int] = [")
+    for level in levels:
+        if level["id"] in summaries:
+            print(f"        {level['id']}: {summaries[level['id']]['seed']},  // {level['name']}")
+    print("    ]")
+    print(f"\n    // Replaces HighScoreEntry(name: name, score: {seed_score}) in seedDefaultScoresIfNeeded")
+    print(f"    scoresByLevel[levelId] = [HighScoreEntry(name: name, score: "
+          f"CampaignState.defaultScores[levelId] ?? {seed_score})]")
+    print("\n    // Proposed declaration (new): score cutoffs for 1/2/3 stars. Stars currently")
+    print("    // come from the platform landed on (LandingPlatform.stars), not the score")
+    print("    static let starThresholds: [Int: [Int]] = [")
+    for level in levels:
+        if level["id"] in summaries:
+            cutoffs = ", ".join(str(cutoff) for cutoff in summaries[level["id"]]["cutoffs"])
+            print(f"        {level['id']}: [{cutoffs}],  // {level['name']}")
+    print("    ]")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score distributions and star cutoffs for calculateScore")
+    parser.add_argument("--levels", type=int, nargs="+", metavar="ID", help="Level IDs to calibrate (default: all)")
+    parser.add_argument("--runs", type=str, metavar="FILE", help="Per-lander data from simulate_landings.py --save")
+    parser.add_argument("-n", "--landers", type=int, default=4000, metavar="N",
+                        help="Landers per level when simulating (default: 4000)")
+    parser.add_argument("--synthetic", type=int, metavar="N",
+                        help="Score N uniform touchdowns over the safe envelope instead of per-level data")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--jobs", type=int, default=1, metavar="N", help="Simulator worker processes (default: 1)")
+    parser.add_argument("--percentiles", type=float, nargs=3, default=DEFAULT_PERCENTILES, metavar="P",
+                        help="Score percentiles for the 1/2/3-star cutoffs (default: 50 80 95)")
+    parser.add_argument("--reference", type=str, metavar="FILE",
+                        help="JSON reference vectors captured from the app (default: built-in vectors)")
+    parser.add_argument("--check", action="store_true", help="Only verify the mirror against the reference vectors")
+    parser.add_argument("--swift", action="store_true", help="Print seed scores and cutoffs as proposed Swift declarations")
+    args = parser.parse_args()
+
+    weights = load_score_weights()
+    thresholds = load_thresholds()
+    platforms = load_platforms()
+    seed_score = load_seed_score()
+
+    vectors = load_reference(Path(args.reference) if args.reference else None)
+    mismatches = check_reference(vectors, weights, thresholds, platforms)
+    for inputs, expected, got in mismatches:
+        print(f"MISMATCH {inputs}: Swift {expected}, mirror {got}")
+    print(f"Reference vectors: {len(vectors) - len(mismatches)}/{len(vectors)} match")
+    if mismatches:
+        sys.exit(1)
+    if args.check:
+        return
+
+    percentiles = tuple(sorted(args.percentiles))
+    if args.synthetic:
+        samples = synthetic_samples(np.random.default_rng(args.seed), args.synthetic, thresholds, platforms)
+        start = time.perf_counter()
+        scores = calculate_scores(samples, weights, thresholds, platforms)
+        elapsed = time.perf_counter() - start
+        print()
+        print_report([("Envelope", summarize(scores, samples["platform"], percentiles, seed_score))],
+                     percentiles, seed_score)
+        print(f"\nScored {len(scores):,} touchdowns in {elapsed:.2f}s ({len(scores) / elapsed / 1e6:.1f}M/s)")
+        return
+
+    levels = load_levels()
+    if args.levels:
+        levels = [level for level in levels if level["id"] in args.levels]
+        if not levels:
+            parser.error("no matching level IDs")
+    if args.runs:
+        runs = load_runs(Path(args.runs), levels)
+    else:
+        simulated = sweep(levels, args.landers, args.seed, SCREEN, args.jobs, False)
+        runs = {level_id: landed_samples(result) for (level_id, _, _), (_, result) in simulated.items()}
+
+    summaries = {}
+    for level in levels:
+        if level["id"] in runs:
+            samples = runs[level["id"]]
+            scores = calculate_scores(samples, weights, thresholds, platforms)
+            summaries[level["id"]] = summarize(scores, samples["platform"], percentiles, seed_score)
+    print()
+    print_report([(f"{level['id']:>2} {level['name']}", summaries[level["id"]])
+                  for level in levels if level["id"] in summaries], percentiles, seed_score)
+    print(f"\nCutoffs are score percentiles of successful landings, rounded down to {CUTOFF_ROUNDING}; "
+          f"seed = median landed score (currently {seed_score} for every level)")
+    if args.swift:
+        print_swift(levels, summaries, seed_score)
+
+
+if __name__ == "__main__":
+    main()
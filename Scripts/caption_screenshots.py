@@ -4,17 +4,34 @@ Bake marketing captions onto App Store screenshots.
 
 Usage:
     python3 Scripts/caption_screenshots.py
+    python3 Scripts/caption_screenshots.py --locales Scripts/captions --devices DIR [DIR ...]
 
 Reads from Screenshots/v2.0.0/, writes captioned versions to the same directory.
-Requires: Pillow (pip install Pillow)
+With --locales, captions come from per-locale JSON files and every
+(device, locale, screenshot) is rendered as one batch on a worker pool,
+written to <output>/<device>/<locale>/.
+With --auto, y_top and pill opacity are chosen per screenshot by scanning for
+the first busy UI region instead of using the hand-tuned values.
+Requires: Pillow, NumPy (pip install Pillow numpy)
 """
 
 import os
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 # --- Configuration ---
 
 SCREENSHOTS_DIR = os.path.join(os.path.dirname(__file__), '..', 'Screenshots', 'v2.0.0')
+LOCALIZED_DIR = os.path.join(os.path.dirname(__file__), '..', 'Screenshots', 'localized')
+
+# Screenshot size the layout constants below are tuned for; other device
+# sizes scale the caption by width / REFERENCE_SIZE[0]
+REFERENCE_SIZE = (1284, 2778)
 
 # Font: SF Compact Black (macOS system font)
 # Fallback chain for other systems
@@ -33,6 +50,14 @@ PILL_COLOR = (20, 20, 30, 190)    # dark blue-black at ~75% opacity
 PILL_PADDING_H = 50               # horizontal padding inside pill
 PILL_PADDING_V = 14               # vertical padding inside pill
 PILL_RADIUS = 24                   # corner radius
+DEFAULT_Y_TOP = 140                # pill top for screenshots without a CAPTIONS entry
+
+# Auto-placement (--auto), in REFERENCE_SIZE pixels
+SCAN_TOP = 140                     # first row below the status bar / Dynamic Island
+SCAN_DEPTH = 0.4                   # fraction of the frame height scanned for UI
+BUSY_THRESHOLD = 3.0               # smoothed mean |dI/dx| per row that counts as UI
+AUTO_GAP = 40                      # preferred gap between pill bottom and first busy row
+AUTO_OPACITY = (150, 215)          # pill alpha over clear sky .. fully over busy UI
 
 # Caption definitions: (filename, line1, line2, y_top, pill_color_override)
 # y_top: top edge of pill, tuned per screenshot to sit as header with gap before HUD
@@ -51,34 +76,107 @@ CAPTIONS = [
 ]
 
 
+@lru_cache(maxsize=None)
+def load_font(path, size):
+    """Load a TrueType font once per (path, size) for the whole process."""
+    return ImageFont.truetype(path, size)
+
+
+@lru_cache(maxsize=None)
 def find_font(size):
-    """Load the first available font from candidates."""
+    """Load the first available font from candidates (resolved once per size)."""
     for path in FONT_CANDIDATES:
         if os.path.exists(path):
             try:
-                return ImageFont.truetype(path, size)
+                return load_font(path, size)
             except Exception:
                 continue
     raise RuntimeError(f"No suitable font found. Tried: {FONT_CANDIDATES}")
 
 
+@lru_cache(maxsize=4096)
+def text_bbox(font, text):
+    """font.getbbox(text), memoized per (font, text).
+
+    Fonts come from the load_font cache, so the same object is reused and
+    repeated captions skip FreeType layout.
+    """
+    return font.getbbox(text)
+
+
 def measure_text(font, text):
-    """Return (width, height, y_offset) of text using font bounding box."""
-    bbox = font.getbbox(text)
+    """Return (width, height, y_offset) of text using font bounding box"""
+    bbox = text_bbox(font, text)
     return bbox[2] - bbox[0], bbox[3] - bbox[1], bbox[1]
 
 
-def add_caption(input_path, output_path, line1, line2, y_top, pill_color=None):
-    """Open a screenshot, draw a 2-line caption with background pill, save."""
-    img = Image.open(input_path).convert('RGBA')
+def scaled(value, scale):
+    """Scale a REFERENCE_SIZE pixel measurement to another device size"""
+    return value if scale == 1.0 else int(round(value * scale))
+
+
+def pill_height(scale=1.0):
+    """Height of a 2-line caption pill (independent of the text: uses cap height)"""
+    font = find_font(scaled(FONT_SIZE, scale))
+    _, cap_height, _ = measure_text(font, 'ABCDEFG')
+    return cap_height * 2 + scaled(LINE_SPACING, scale) + scaled(PILL_PADDING_V, scale) * 2
+
+
+def row_energy(img, depth=SCAN_DEPTH):
+    """Smoothed per-row horizontal edge energy of the top of a screenshot.
+
+    Computed on a half-resolution grayscale crop, then repeated back to
+    full-resolution rows, so it costs a few ms per screenshot.
+    """
+    top = img.crop((0, 0, img.width, int(img.height * depth))).convert('L').reduce(2)
+    pixels = np.asarray(top, dtype=np.float32)
+    energy = np.abs(np.diff(pixels, axis=1)).mean(axis=1)
+    energy = np.convolve(energy, np.ones(5, dtype=np.float32) / 5, mode='same')
+    return np.repeat(energy, 2)
+
+
+def auto_place(img, scale=1.0):
+    """Pick (y_top, pill_color) from the first busy UI region below the status bar.
+
+    The pill sits AUTO_GAP above that region when there's room; otherwise it
+    pins to SCAN_TOP and gets more opaque the more busy rows it covers.
+    """
+    energy = row_energy(img)
+    scan_top = scaled(SCAN_TOP, scale)
+    busy = np.flatnonzero(energy[scan_top:] > BUSY_THRESHOLD)
+    busy_y = scan_top + int(busy[0]) if busy.size else len(energy)
+
+    pill_h = pill_height(scale)
+    y_top = max(scan_top, busy_y - scaled(AUTO_GAP, scale) - pill_h)
+
+    covered = energy[y_top:y_top + pill_h]
+    busy_fraction = float((covered > BUSY_THRESHOLD).mean()) if covered.size else 0.0
+    low, high = AUTO_OPACITY
+    alpha = int(round(low + (high - low) * busy_fraction))
+    return y_top, PILL_COLOR[:3] + (alpha,)
+
+
+def caption_image(img, line1, line2, y_top, pill_color=None, scale=1.0):
+    """Draw a 2-line caption with background pill onto an RGBA image, in place.
+
+    Only the caption's bounding box is composited: the region is cropped,
+    blended with a same-sized overlay and pasted back, so cost scales with
+    caption area rather than screenshot size. scale resizes the caption
+    layout for other device sizes (1.0 = REFERENCE_SIZE).
+
+    Returns (region_box, original_region, pill_box) so callers captioning
+    the same image repeatedly can restore it with img.paste(original_region, region_box).
+    """
     width, height = img.size
 
-    # Create overlay for translucent drawing
-    overlay = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(overlay)
+    def px(value):
+        return scaled(value, scale)
 
-    font = find_font(FONT_SIZE)
+    font = find_font(px(FONT_SIZE))
     color = pill_color or PILL_COLOR
+    line_spacing = px(LINE_SPACING)
+    padding_h = px(PILL_PADDING_H)
+    padding_v = px(PILL_PADDING_V)
 
     # Measure both lines
     w1, h1, yoff1 = measure_text(font, line1)
@@ -86,28 +184,21 @@ def add_caption(input_path, output_path, line1, line2, y_top, pill_color=None):
 
     # Use fixed line height based on cap height for consistent pill sizing
     # across ALL CAPS and mixed-case text (descenders extend below)
-    cap_height = font.getbbox('ABCDEFG')[3] - font.getbbox('ABCDEFG')[1]
+    _, cap_height, _ = measure_text(font, 'ABCDEFG')
     line_height = cap_height
-    text_block_h = line_height * 2 + LINE_SPACING
+    text_block_h = line_height * 2 + line_spacing
     text_block_w = max(w1, w2)
 
     # Pill dimensions (centered, clamped to image bounds)
-    pill_w = text_block_w + PILL_PADDING_H * 2
-    pill_h = text_block_h + PILL_PADDING_V * 2
+    pill_w = text_block_w + padding_h * 2
+    pill_h = text_block_h + padding_v * 2
     pill_x0 = max(0, (width - pill_w) // 2)
-    pill_y0 = y_top
+    pill_y0 = px(y_top)
     pill_x1 = min(width, pill_x0 + pill_w)
     pill_y1 = pill_y0 + pill_h
 
-    # Draw background pill
-    draw.rounded_rectangle(
-        (pill_x0, pill_y0, pill_x1, pill_y1),
-        radius=PILL_RADIUS,
-        fill=color
-    )
-
     # Text positioning: centered in pill
-    text_area_y0 = pill_y0 + PILL_PADDING_V
+    text_area_y0 = pill_y0 + padding_v
 
     # Line 1
     x1 = (width - w1) // 2
@@ -115,23 +206,193 @@ def add_caption(input_path, output_path, line1, line2, y_top, pill_color=None):
 
     # Line 2
     x2 = (width - w2) // 2
-    y2_draw = text_area_y0 + line_height + LINE_SPACING - yoff2
+    y2_draw = text_area_y0 + line_height + line_spacing - yoff2
+
+    # Caption region: the pill plus any glyph ink (descenders) that spills past it
+    bbox1 = text_bbox(font, line1)
+    bbox2 = text_bbox(font, line2)
+    rx0 = max(0, min(pill_x0, x1 + bbox1[0], x2 + bbox2[0]))
+    ry0 = max(0, min(pill_y0, y1_draw + bbox1[1], y2_draw + bbox2[1]))
+    rx1 = min(width, max(pill_x1 + 1, x1 + bbox1[2], x2 + bbox2[2]))
+    ry1 = min(height, max(pill_y1 + 1, y1_draw + bbox1[3], y2_draw + bbox2[3]))
+
+    # Overlay covers only the caption region; coordinates shift by its origin
+    overlay = Image.new('RGBA', (rx1 - rx0, ry1 - ry0), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+
+    # Draw background pill
+    draw.rounded_rectangle(
+        (pill_x0 - rx0, pill_y0 - ry0, pill_x1 - rx0, pill_y1 - ry0),
+        radius=px(PILL_RADIUS),
+        fill=color
+    )
+
+    draw.text((x1 - rx0, y1_draw - ry0), line1, fill=(255, 255, 255, 255), font=font)
+    draw.text((x2 - rx0, y2_draw - ry0), line2, fill=(255, 255, 255, 255), font=font)
 
-    draw.text((x1, y1_draw), line1, fill=(255, 255, 255, 255), font=font)
-    draw.text((x2, y2_draw), line2, fill=(255, 255, 255, 255), font=font)
+    # Composite overlay onto just that region of the original
+    region_box = (rx0, ry0, rx1, ry1)
+    region = img.crop(region_box)
+    img.paste(Image.alpha_composite(region, overlay), (rx0, ry0))
+    return region_box, region, (pill_x0, pill_y0, pill_x1, pill_y1)
 
-    # Composite overlay onto original
-    result = Image.alpha_composite(img, overlay)
+
+def open_rgba(path):
+    """Decode a screenshot as RGBA (no copy when it already is)"""
+    img = Image.open(path)
+    if img.mode != 'RGBA':
+        img = img.convert('RGBA')
+    return img
+
+
+def add_caption(input_path, output_path, line1, line2, y_top, pill_color=None, auto=False):
+    """Open a screenshot, draw a 2-line caption with background pill, save.
+
+    auto=True ignores y_top / pill_color and uses auto_place instead.
+    """
+    img = open_rgba(input_path)
+    if auto:
+        y_top, pill_color = auto_place(img)
+    color = pill_color or PILL_COLOR
+    _, _, (pill_x0, pill_y0, pill_x1, pill_y1) = caption_image(img, line1, line2, y_top, color)
 
     # Save as PNG (lossless)
-    result.save(output_path, 'PNG', optimize=False)
+    img.save(output_path, 'PNG', optimize=False)
 
     opacity_pct = round(color[3] / 255 * 100)
-    print(f"  Pill: ({pill_x0},{pill_y0}) to ({pill_x1},{pill_y1}), h={pill_h}px, opacity={opacity_pct}%")
-    return result.size
+    print(f"  Pill: ({pill_x0},{pill_y0}) to ({pill_x1},{pill_y1}), h={pill_y1 - pill_y0}px, opacity={opacity_pct}%")
+    return img.size
+
+
+# --- Localized batch ---
+
+def load_locale_captions(locales_dir):
+    """Read <locale>.json caption files into {locale: [caption entries]}.
+
+    Each file maps a screenshot filename to {"line1", "line2"} and may
+    override "y_top" / "pill_color"; layout defaults come from CAPTIONS.
+    """
+    layout = {filename: (y_top, pill) for filename, _, _, y_top, pill in CAPTIONS}
+    locales = {}
+    for name in sorted(os.listdir(locales_dir)):
+        locale, ext = os.path.splitext(name)
+        if ext != '.json':
+            continue
+        with open(os.path.join(locales_dir, name), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        entries = []
+        for filename, caption in data.items():
+            y_top, pill = layout.get(filename, (DEFAULT_Y_TOP, None))
+            pill = caption.get('pill_color', pill)
+            entries.append((filename, caption['line1'], caption['line2'],
+                            caption.get('y_top', y_top), tuple(pill) if pill else None))
+        locales[locale] = entries
+    return locales
+
+
+def build_batch_jobs(locales, device_dirs, output_root, auto=False):
+    """Group caption jobs by source screenshot so each is decoded exactly once.
+
+    Returns [(input_path, auto, [(output_path, line1, line2, y_top, pill), ...]), ...].
+    """
+    grouped = {}
+    for device_dir in device_dirs:
+        device = os.path.basename(os.path.normpath(device_dir))
+        for locale, entries in locales.items():
+            for filename, line1, line2, y_top, pill in entries:
+                input_path = os.path.join(device_dir, filename)
+                if not os.path.exists(input_path):
+                    continue
+                base, ext = os.path.splitext(filename)
+                output_path = os.path.join(output_root, device, locale, f"{base}_captioned{ext}")
+                grouped.setdefault(input_path, []).append((output_path, line1, line2, y_top, pill))
+    return [(input_path, auto, outputs) for input_path, outputs in sorted(grouped.items())]
+
+
+def caption_source(job):
+    """Worker: decode one screenshot, then caption and save it once per locale.
+
+    The captioned region is restored after each save, so every locale starts
+    from the pristine decoded pixels without re-decoding or copying the frame.
+    """
+    input_path, auto, outputs = job
+    img = open_rgba(input_path)
+    img.load()
+    scale = img.width / REFERENCE_SIZE[0]
+    if auto:
+        # Placement depends only on the pixels, so one scan serves every locale
+        auto_y_top, auto_pill = auto_place(img, scale)
+    for output_path, line1, line2, y_top, pill in outputs:
+        if auto:
+            # auto_place works in device pixels; caption_image expects reference pixels
+            y_top, pill = int(round(auto_y_top / scale)), auto_pill
+        region_box, original, _ = caption_image(img, line1, line2, y_top, pill, scale)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        img.save(output_path, 'PNG', optimize=False)
+        img.paste(original, region_box[:2])
+    return len(outputs), img.width * img.height * len(outputs)
+
+
+def run_batch(locales_dir, device_dirs, output_root, jobs=None, auto=False):
+    """Caption every (device, locale, screenshot) on a process pool and report throughput"""
+    locales = load_locale_captions(locales_dir)
+    batch = build_batch_jobs(locales, device_dirs, output_root, auto)
+    total = sum(len(outputs) for _, _, outputs in batch)
+    print(f"Captioning {total} image(s): {len(locales)} locale(s) x {len(device_dirs)} device(s), "
+          f"{len(batch)} source screenshot(s)")
+
+    start = time.perf_counter()
+    images = pixels = 0
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for count, px in pool.map(caption_source, batch):
+            images += count
+            pixels += px
+    elapsed = time.perf_counter() - start
+
+    rate = images / elapsed if elapsed > 0 else 0.0
+    mpx = pixels / 1e6 / elapsed if elapsed > 0 else 0.0
+    print(f"Done: {images} image(s) in {elapsed:.2f}s ({rate:.1f} img/s, {mpx:.0f} MPix/s) -> {output_root}")
+    return images
+
+
+def suggest_placements(dirs):
+    """Report auto_place results for every screenshot in dirs (no decoding past the scan)"""
+    paths = sorted(os.path.join(d, f) for d in dirs for f in os.listdir(d)
+                   if f.endswith('.png') and '_captioned' not in f)
+    start = time.perf_counter()
+    for path in paths:
+        with Image.open(path) as img:
+            scale = img.width / REFERENCE_SIZE[0]
+            y_top, pill = auto_place(img, scale)
+        print(f"{os.path.relpath(path)}: y_top={y_top} alpha={pill[3]}")
+    elapsed = time.perf_counter() - start
+    print(f"\n{len(paths)} screenshots in {elapsed:.2f}s "
+          f"({len(paths) / elapsed if elapsed else 0:.1f} screenshots/s)")
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Bake marketing captions onto App Store screenshots")
+    parser.add_argument('--locales', metavar='DIR', help="Directory of <locale>.json caption files (batch mode)")
+    parser.add_argument('--devices', nargs='+', metavar='DIR',
+                        help="Screenshot directories, one per device size (default: Screenshots/v2.0.0)")
+    parser.add_argument('--output', metavar='DIR', help="Batch output root (default: Screenshots/localized)")
+    parser.add_argument('--jobs', type=int, metavar='N', help="Worker processes (default: CPU count)")
+    parser.add_argument('--auto', action='store_true',
+                        help="Pick pill position and opacity from each screenshot's content")
+    parser.add_argument('--suggest', nargs='+', metavar='DIR',
+                        help="Print auto placements for every PNG in DIR(s) without writing images")
+    args = parser.parse_args()
+
+    if args.suggest:
+        suggest_placements(args.suggest)
+        return
+
+    if args.locales:
+        device_dirs = [os.path.abspath(d) for d in (args.devices or [SCREENSHOTS_DIR])]
+        run_batch(args.locales, device_dirs, os.path.abspath(args.output or LOCALIZED_DIR),
+                  args.jobs, args.auto)
+        return
+
     screenshots_dir = os.path.abspath(SCREENSHOTS_DIR)
     print(f"Screenshots directory: {screenshots_dir}")
     print(f"Font size: {FONT_SIZE}px, Default pill: {PILL_COLOR}")
@@ -148,7 +409,7 @@ def main():
             print(f"SKIP: {filename} not found")
             continue
 
-        size = add_caption(input_path, output_path, line1, line2, y_top, pill_override)
+        size = add_caption(input_path, output_path, line1, line2, y_top, pill_override, args.auto)
         print(f"OK: {output_name} ({size[0]}x{size[1]})")
 
     print("\nDone.")
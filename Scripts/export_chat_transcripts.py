@@ -2,47 +2,388 @@
 """
 Export Claude Code chat transcripts to readable Markdown.
 
-Reads JSONL conversation files from ~/.claude/projects/ and converts them
-to Markdown files in Docs/ChatTranscripts/.
+Reads JSONL conversation files from every project directory under
+~/.claude/projects/ matching PROJECT_PATTERN (--project, --projects-root) and converts them
+to Markdown files in Docs/ChatTranscripts/. Archived sessions compressed as
+.jsonl.gz / .jsonl.xz / .jsonl.bz2 are read the same way, decompressed as a
+stream. Subagent sessions (agent-*.jsonl)
+are rendered inline, after the result of the Task call that spawned them.
 
 Usage:
     python3 Scripts/export_chat_transcripts.py                # Export all sessions
     python3 Scripts/export_chat_transcripts.py --latest 3     # Export 3 most recent
     python3 Scripts/export_chat_transcripts.py --session ID   # Export specific session
     python3 Scripts/export_chat_transcripts.py --list         # List available sessions
+    python3 Scripts/export_chat_transcripts.py --all --jobs 8 # Export on 8 worker processes
+    python3 Scripts/export_chat_transcripts.py --search "venus wind"  # Ranked full-text search
+    python3 Scripts/export_chat_transcripts.py --latest 1 --watch     # Keep the live session exported
+    python3 Scripts/export_chat_transcripts.py --session ID --range 4000:4100  # Print JSONL lines 4000-4099
+    python3 Scripts/export_chat_transcripts.py --stats        # Tool latency / busiest days / largest outputs
+    python3 Scripts/export_chat_transcripts.py --no-redact    # Keep tokens / keys / home paths verbatim
+    python3 Scripts/export_chat_transcripts.py --list --project '*'  # Sessions of every project
+
+Session metadata for --list / --session is cached in a SQLite index
+(Scripts/.cache/transcript_index.sqlite) keyed by (path, size, mtime), so
+only new or changed JSONL files are re-parsed. --reindex rebuilds it.
+The same database holds an inverted index (term -> message postings) of
+the user / assistant text for --search, and a per-session byte offset and
+running metadata so reruns only parse and append newly written lines.
+
+Exported Markdown is passed through a Redactor: API keys, tokens, private
+keys, key=value secrets and /Users/<name> home paths are replaced, since
+Docs/ChatTranscripts/ is committed.
 """
 
+import io
+import bz2
+import gzip
 import json
+import lzma
+import hashlib
+import heapq
+import math
+import mmap
 import os
+import re
 import sys
+import shutil
+import sqlite3
 import argparse
-from datetime import datetime
+import tempfile
+import time
+import traceback
+from array import array
+from collections import Counter
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
 from pathlib import Path
 
-# Project-specific transcript directory
-PROJECT_DIR = "-Users-tboliveira-Projetos-StarshipLander"
-TRANSCRIPTS_PATH = Path.home() / ".claude" / "projects" / PROJECT_DIR
+# Transcript directories: one per project under PROJECTS_ROOT, named after the
+# project's path with "/" replaced by "-" (so it differs per machine / CI runner)
+PROJECTS_ROOT = Path.home() / ".claude" / "projects"
+PROJECT_PATTERN = "*StarshipLander*"
+# Project directories listed / stat()ed concurrently by session_files()
+SCAN_THREADS = 8
 OUTPUT_DIR = Path(__file__).resolve().parent.parent / "Docs" / "ChatTranscripts"
 
+# Session files: plain JSONL, or archived with one of these compressors
+SESSION_SUFFIX = ".jsonl"
+COMPRESSED_OPENERS = {".gz": gzip.open, ".xz": lzma.open, ".bz2": bz2.open}
 
-def load_session(filepath: Path) -> list[dict]:
-    """Load all entries from a JSONL session file."""
-    entries = []
-    with open(filepath, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
+# Buffer size for streaming transcript output
+WRITE_BUFFER = 1 << 20
+
+# Session metadata index (see refresh_index)
+INDEX_FILE = Path(__file__).resolve().parent / ".cache" / "transcript_index.sqlite"
+INDEX_VERSION = 6
+INDEX_FIELDS = ("session_id", "timestamp_start", "timestamp_end", "version", "branch",
+                "user_messages", "assistant_messages", "tool_calls", "first_user_message")
+INDEX_TABLES = ("sessions", "search_files", "messages", "postings", "exports")
+INDEX_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS sessions (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, "
+    + ", ".join(INDEX_FIELDS) + ")",
+    "CREATE INDEX IF NOT EXISTS sessions_by_id ON sessions (session_id)",
+    # Full-text search: one row per rendered message, postings per (term, message)
+    "CREATE TABLE IF NOT EXISTS search_files (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER)",
+    "CREATE TABLE IF NOT EXISTS messages (id INTEGER PRIMARY KEY, path TEXT, session_id TEXT, "
+    "msg_no INTEGER, role TEXT, timestamp TEXT, length INTEGER, text TEXT)",
+    "CREATE INDEX IF NOT EXISTS messages_by_path ON messages (path)",
+    "CREATE TABLE IF NOT EXISTS postings (term TEXT, message_id INTEGER, tf INTEGER, "
+    "PRIMARY KEY (term, message_id)) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS postings_by_message ON postings (message_id)",
+    # Incremental export: where each (session, output dir) export left off
+    "CREATE TABLE IF NOT EXISTS exports (path TEXT, output_dir TEXT, output_file TEXT, offset INTEGER, "
+    "signature TEXT, header_len INTEGER, output_size INTEGER, info TEXT, pending_tasks TEXT, redaction TEXT, "
+    "PRIMARY KEY (path, output_dir))",
+)
+# Bytes before the saved offset that must be unchanged for an append to be valid
+SIGNATURE_BYTES = 4096
+# --watch polling interval (seconds)
+WATCH_INTERVAL = 2.0
+
+# --paginate target page size (KB)
+PAGE_KB = 256
+
+# Tool calls that spawn a subagent session (agent-*.jsonl)
+SUBAGENT_TOOLS = ("Task", "Agent")
+
+# Columnar usage records for --stats (see build_analytics)
+ANALYTICS_FILE = Path(__file__).resolve().parent / ".cache" / "analytics.npz"
+MS_PER_DAY = 86_400_000
+
+# Sidecar line-offset indexes for --range (see load_line_offsets)
+LINE_INDEX_DIR = Path(__file__).resolve().parent / ".cache" / "line_offsets"
+
+# --search tokenizer and BM25 ranking parameters
+TOKEN_PATTERN = re.compile(r"\w\w+")
+BM25_K1 = 1.2
+BM25_B = 0.75
+SNIPPET_CHARS = 60
+
+# Secrets and local paths scrubbed from exported Markdown (see Redactor):
+# (name, trigger literals, pattern matched at a trigger, replacement).
+# Triggers are plain literals so they compile into one prefix-trie regex;
+# case variants are spelled out because (?i) defeats re's literal scanning.
+REDACTED = "[REDACTED]"
+REDACTION_RULES = (
+    ("private_key", ("-----BEGIN",),
+     r"(?s)-----BEGIN [A-Z ]*PRIVATE KEY-----.*?-----END [A-Z ]*PRIVATE KEY-----", REDACTED),
+    ("aws_key", ("AKIA", "ASIA"), r"A[SK]IA[0-9A-Z]{16}\b", REDACTED),
+    ("github_token", ("ghp_", "gho_", "ghu_", "ghs_", "ghr_", "github_pat_"),
+     r"(?:gh[pousr]_[A-Za-z0-9]{36,}|github_pat_[A-Za-z0-9_]{22,})", REDACTED),
+    ("api_key", ("sk-",), r"sk-[A-Za-z0-9_-]{20,}", REDACTED),
+    ("slack_token", ("xox",), r"xox[abposr]-[A-Za-z0-9-]{10,}", REDACTED),
+    ("google_key", ("AIza",), r"AIza[0-9A-Za-z_-]{35}", REDACTED),
+    ("jwt", ("eyJ",), r"eyJ[\w-]{10,}\.eyJ[\w-]{10,}\.[\w-]{10,}", REDACTED),
+    ("bearer", ("Bearer", "bearer"), r"([Bb]earer\s+)[A-Za-z0-9._~+/-]{16,}=*", r"\1" + REDACTED),
+    ("assignment", ("api_key", "apikey", "api-key", "API_KEY", "APIKEY", "secret", "Secret", "SECRET",
+                    "token", "Token", "TOKEN", "password", "Password", "PASSWORD", "passwd"),
+     r"""([\w-]*\s*[:=]\s*["']?)(?=[^\s"']*\d)[A-Za-z0-9+/_.~-]{12,}""", r"\1" + REDACTED),
+    ("home_path", ("/Users/", "/home/"), r"/(?:Users|home)/(?!Shared\b)[^/\s\"'`)\]]+", "~"),
+)
+# Rules whose trigger must not continue a word (assignment keywords may: client_secret=...)
+REDACTION_WORD_START = {"aws_key", "github_token", "api_key", "slack_token", "google_key", "jwt",
+                        "bearer", "home_path"}
+
+
+# Entry types the exporter renders; everything else only feeds session metadata
+RENDERED_TYPES = ("user", "assistant")
+RENDERED_TYPE_PATTERN = re.compile(rb'"type"\s*:\s*"(?:%s)"' % b"|".join(t.encode() for t in RENDERED_TYPES))
+# Scalar header fields update_session_info() reads from every entry
+HEADER_PATTERNS = tuple(
+    (key, re.compile(rb'"%s"\s*:\s*"([^"\\]*(?:\\.[^"\\]*)*)"' % key.encode()))
+    for key in ("sessionId", "version", "gitBranch", "timestamp")
+)
+JSON_STRING_PATTERN = re.compile(rb'"(?:[^"\\]|\\.)*"')
+
+
+def is_top_level(line: bytes, pos: int) -> bool:
+    """Whether pos in a one-object JSON line sits in the outermost object, not a nested value."""
+    if line.find(b"{", 1, pos) < 0 and line.find(b"[", 1, pos) < 0:
+        return True
+    prefix = JSON_STRING_PATTERN.sub(b"", line[:pos])
+    depth = prefix.count(b"{") + prefix.count(b"[") - prefix.count(b"}") - prefix.count(b"]")
+    return depth == 1
+
+
+def header_stub(line: bytes) -> dict:
+    """Top-level session header fields of a raw entry line, without decoding the rest of it.
+
+    Keys of nested objects (a snapshot's or a progress message's timestamp)
+    are skipped, matching what update_session_info() reads from a decoded entry.
+    """
+    stub = {}
+    for key, pattern in HEADER_PATTERNS:
+        for match in pattern.finditer(line):
+            if is_top_level(line, match.start()):
+                value = match.group(1)
+                stub[key] = json.loads(b'"' + value + b'"') if b"\\" in value else value.decode()
+                break
+    return stub
+
+
+def is_compressed(filepath: Path) -> bool:
+    return filepath.suffix in COMPRESSED_OPENERS
+
+
+def session_name(filepath: Path) -> str:
+    """File name without .jsonl and any compression suffix (the session ID for top-level sessions)."""
+    name = filepath.name
+    if filepath.suffix in COMPRESSED_OPENERS:
+        name = name[:-len(filepath.suffix)]
+    return name[:-len(SESSION_SUFFIX)] if name.endswith(SESSION_SUFFIX) else name
+
+
+def glob_sessions(directory: Path, prefix: str = "") -> list[Path]:
+    """Session files named prefix*.jsonl in directory, plain or compressed.
+
+    When a session exists both plain and compressed (archived but not yet
+    removed), only the plain file is returned.
+    """
+    found = {}
+    for suffix in ("", *COMPRESSED_OPENERS):
+        for f in directory.glob(f"{prefix}*{SESSION_SUFFIX}{suffix}"):
+            found.setdefault(session_name(f), f)
+    return list(found.values())
+
+
+def open_session(filepath: Path):
+    """Open a session file for binary line reading, decompressing archives on the fly."""
+    opener = COMPRESSED_OPENERS.get(filepath.suffix)
+    return opener(filepath, "rb") if opener else open(filepath, "rb")
+
+
+class EntryReader:
+    """Iterate entries of a binary JSONL file from its current position.
+
+    f may be a decompressing stream (see open_session); offsets are then
+    positions in the decompressed data.
+
+    `offset` tracks the end of the last consumed line. A final line without
+    a newline is consumed only if it decodes (it may still be being written),
+    so offset is always a safe place to resume from.
+
+    With lazy=True, lines whose raw bytes don't mention a rendered entry type
+    (progress, system, summary, snapshot, ...) are not JSON-decoded; they
+    yield a stub holding only the header fields that session metadata needs.
+    Lines that do match are decoded in full and filtered on their real type
+    downstream, so a false positive only costs a decode.
+    """
+
+    def __init__(self, f, lazy: bool = False):
+        self.f = f
+        self.lazy = lazy
+        self.offset = f.tell()
+
+    def __iter__(self):
+        for raw in self.f:
+            line = raw.strip()
+            if not raw.endswith(b"\n"):
+                try:
+                    entry = json.loads(line) if line else None
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    return
+                self.offset += len(raw)
+                if entry is not None:
+                    yield entry
+                return
+
+            self.offset += len(raw)
             if not line:
                 continue
+            if self.lazy and not RENDERED_TYPE_PATTERN.search(line):
+                if line.startswith(b"{") and line.endswith(b"}"):
+                    yield header_stub(line)
+                continue
             try:
-                entries.append(json.loads(line))
+                yield json.loads(line)
             except json.JSONDecodeError:
                 continue
-    return entries
 
 
-def get_session_info(entries: list[dict]) -> dict:
-    """Extract metadata from session entries."""
-    info = {
+def iter_entries(filepath: Path, lazy: bool = False):
+    """Yield entries from a JSONL session file one line at a time (see EntryReader)."""
+    with open_session(filepath) as f:
+        yield from EntryReader(f, lazy)
+
+
+def build_line_offsets(buf) -> array:
+    """Start offset of every line in buf (a bytes-like JSONL file image).
+
+    One pass of find(), which is a SIMD memchr over the mapped pages; for
+    transcript-sized lines this beats a NumPy mask-and-flatnonzero scan.
+    """
+    starts = array("q", [0])
+    pos = buf.find(b"\n")
+    while pos != -1 and pos + 1 < len(buf):
+        starts.append(pos + 1)
+        pos = buf.find(b"\n", pos + 1)
+    return starts
+
+
+def load_line_offsets(filepath: Path, buf) -> array:
+    """Line start offsets for filepath, from its sidecar index when still valid.
+
+    The sidecar (in LINE_INDEX_DIR) is [size, mtime_ns, offsets...] as int64;
+    it is rebuilt with one newline scan whenever the file's size or mtime
+    no longer match.
+    """
+    st = filepath.stat()
+    sidecar = LINE_INDEX_DIR / (hashlib.sha1(str(filepath).encode()).hexdigest()[:16] + ".offsets")
+    if sidecar.exists():
+        stored = array("q")
+        stored.frombytes(sidecar.read_bytes())
+        if stored[:2] == array("q", [st.st_size, st.st_mtime_ns]):
+            return stored[2:]
+
+    offsets = build_line_offsets(buf) if len(buf) else array("q")
+    LINE_INDEX_DIR.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("wb", dir=LINE_INDEX_DIR, delete=False) as tmp:
+        tmp.write(array("q", [st.st_size, st.st_mtime_ns]).tobytes())
+        tmp.write(offsets.tobytes())
+    os.replace(tmp.name, sidecar)
+    return offsets
+
+
+def parse_range(spec: str) -> slice:
+    """Parse an "A:B" line range (Python slice semantics; either end may be omitted)."""
+    start, sep, stop = spec.partition(":")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"range must look like A:B, got '{spec}'")
+    try:
+        return slice(int(start) if start else None, int(stop) if stop else None)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"range must look like A:B, got '{spec}'")
+
+
+def read_entry_range(filepath: Path, lines: slice):
+    """Yield (line_no, entry) for JSONL lines in the slice, decoding only those lines.
+
+    The file is memory-mapped and located through its line-offset index, so
+    the cost depends on the size of the range, not of the session. Compressed
+    archives can't be mapped; they are decompressed as a stream up to the
+    end of the range, decoding only lines inside it.
+    """
+    if is_compressed(filepath):
+        with open_session(filepath) as f:
+            if (lines.start or 0) < 0 or (lines.stop or 0) < 0:
+                # Negative bounds need the line count first
+                lines = slice(*lines.indices(sum(1 for _ in f)))
+                f.seek(0)
+            for line_no, raw in islice(enumerate(f), lines.start, lines.stop, lines.step):
+                line = raw.strip()
+                if not line:
+                    continue
+                try:
+                    yield line_no, json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+        return
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            offsets = load_line_offsets(filepath, mm)
+            for line_no in range(*lines.indices(len(offsets))):
+                end = offsets[line_no + 1] if line_no + 1 < len(offsets) else len(mm)
+                line = mm[offsets[line_no]:end].strip()
+                if not line:
+                    continue
+                try:
+                    yield line_no, json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+
+def print_entry_range(filepath: Path, lines: slice):
+    """Print the rendered sections for a range of JSONL lines of one session."""
+    rendered = 0
+    first = last = None
+    for line_no, entry in read_entry_range(filepath, lines):
+        first = line_no if first is None else first
+        last = line_no
+        section = format_entry(entry)
+        if section is not None:
+            print(f"<!-- line {line_no} -->")
+            print(section)
+            rendered += 1
+    if first is None:
+        bounds = ":".join("" if bound is None else str(bound) for bound in (lines.start, lines.stop))
+        print(f"No entries in range {bounds} of {filepath.name}")
+    else:
+        print(f"<!-- {filepath.name}: lines {first}-{last}, {rendered} rendered message(s) -->")
+
+
+def load_session(filepath: Path) -> list[dict]:
+    """Load all entries from a JSONL session file."""
+    return list(iter_entries(filepath))
+
+
+def new_session_info() -> dict:
+    """Empty session metadata, filled in by update_session_info()."""
+    return {
         "session_id": None,
         "timestamp_start": None,
         "timestamp_end": None,
@@ -54,44 +395,62 @@ def get_session_info(entries: list[dict]) -> dict:
         "first_user_message": "",
     }
 
-    for entry in entries:
-        if entry.get("sessionId") and not info["session_id"]:
-            info["session_id"] = entry["sessionId"]
-        if entry.get("version") and not info["version"]:
-            info["version"] = entry["version"]
-        if entry.get("gitBranch") and not info["branch"]:
-            info["branch"] = entry["gitBranch"]
-
-        ts = entry.get("timestamp")
-        if ts:
-            if not info["timestamp_start"]:
-                info["timestamp_start"] = ts
-            info["timestamp_end"] = ts
-
-        msg_type = entry.get("type")
-        if msg_type == "user":
-            info["user_messages"] += 1
-            content = entry.get("message", {}).get("content", "")
-            if isinstance(content, str) and content and not info["first_user_message"]:
-                info["first_user_message"] = content[:100]
-            elif isinstance(content, list):
-                for block in content:
-                    if block.get("type") == "tool_result":
-                        info["tool_calls"] += 1
-                    elif block.get("type") == "text" and not info["first_user_message"]:
-                        info["first_user_message"] = block.get("text", "")[:100]
-        elif msg_type == "assistant":
-            info["assistant_messages"] += 1
 
+def update_session_info(info: dict, entry: dict):
+    """Fold one session entry into the metadata dict."""
+    if entry.get("sessionId") and not info["session_id"]:
+        info["session_id"] = entry["sessionId"]
+    if entry.get("version") and not info["version"]:
+        info["version"] = entry["version"]
+    if entry.get("gitBranch") and not info["branch"]:
+        info["branch"] = entry["gitBranch"]
+
+    ts = entry.get("timestamp")
+    if ts:
+        if not info["timestamp_start"]:
+            info["timestamp_start"] = ts
+        info["timestamp_end"] = ts
+
+    msg_type = entry.get("type")
+    if msg_type == "user":
+        info["user_messages"] += 1
+        content = entry.get("message", {}).get("content", "")
+        if isinstance(content, str) and content and not info["first_user_message"]:
+            info["first_user_message"] = content[:100]
+        elif isinstance(content, list):
+            for block in content:
+                if block.get("type") == "tool_result":
+                    info["tool_calls"] += 1
+                elif block.get("type") == "text" and not info["first_user_message"]:
+                    info["first_user_message"] = block.get("text", "")[:100]
+    elif msg_type == "assistant":
+        info["assistant_messages"] += 1
+
+
+def get_session_info(entries) -> dict:
+    """Extract metadata from session entries (any iterable, consumed once)."""
+    info = new_session_info()
+    for entry in entries:
+        update_session_info(info, entry)
     return info
 
 
-def extract_text_content(content) -> str:
-    """Extract readable text from message content."""
+def extract_text_content(content, sidecar=None) -> str:
+    """Extract readable text from message content.
+
+    sidecar(tool_use_id, text) -> link, if given, receives tool results too
+    long to inline, and the placeholder becomes a link to the stored output.
+    """
     if isinstance(content, str):
         return content
     if isinstance(content, list):
         parts = []
+
+        def oversized(block, text):
+            if sidecar is None:
+                return f"({len(text)} chars)"
+            return f"[{len(text):,} chars]({sidecar(block.get('tool_use_id'), text)})"
+
         for block in content:
             btype = block.get("type", "")
             if btype == "text":
@@ -115,7 +474,9 @@ def extract_text_content(content) -> str:
                             if len(text) < 200:
                                 parts.append(f"> Tool result: {text}")
                             else:
-                                parts.append(f"> Tool result: ({len(text)} chars)")
+                                parts.append(f"> Tool result: {oversized(block, text)}")
+                elif sidecar is not None and isinstance(content_inner, str):
+                    parts.append(f"> Tool result: {oversized(block, content_inner)}")
                 else:
                     parts.append("> Tool result: (output omitted)")
         return "\n\n".join(parts)
@@ -136,7 +497,7 @@ def format_tool_call(name: str, input_data: dict) -> str:
     elif name == "Bash":
         cmd = input_data.get("command", "?")
         if len(cmd) > 120:
-            cmd = cmd[:120] + "..."
+            cmd = CLIP_GUARD.clip(cmd, 120) + "..."
         return f"*Run: `{cmd}`*"
     elif name == "Glob":
         pattern = input_data.get("pattern", "?")
@@ -170,27 +531,153 @@ def format_timestamp(ts_str: str) -> str:
         return ts_str or "Unknown"
 
 
-def export_session(filepath: Path, output_dir: Path, verbose: bool = False) -> Path:
-    """Export a single session JSONL to Markdown."""
-    entries = load_session(filepath)
-    if not entries:
+def format_timestamp_ms(ts_str: str) -> str:
+    """Format ISO timestamp to readable form with millisecond precision."""
+    try:
+        dt = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+        return dt.strftime("%Y-%m-%d %H:%M:%S.") + f"{dt.microsecond // 1000:03d} UTC"
+    except (ValueError, AttributeError):
+        return ts_str or "Unknown"
+
+
+def is_tool_results(content) -> bool:
+    """True for user content made only of tool_result blocks."""
+    return isinstance(content, list) and all(b.get("type") == "tool_result" for b in content)
+
+
+def entry_text(entry: dict, sidecar=None) -> str:
+    """Readable text of a user / assistant entry, or None if the transcript skips it.
+
+    With a sidecar (paginated output), pure tool_result entries are kept:
+    their outputs are cheap links rather than inline clutter.
+    """
+    entry_type = entry.get("type")
+
+    if entry_type == "user":
+        content = entry.get("message", {}).get("content", "")
+        # Skip pure tool_result entries (they clutter the transcript) before
+        # touching their payloads
+        if sidecar is None and is_tool_results(content):
+            return None
+    elif entry_type == "assistant":
+        content = entry.get("message", {}).get("content", [])
+        # Skip thinking-only blocks
+        if isinstance(content, list) and all(b.get("type") == "thinking" for b in content):
+            return None
+    else:
         return None
 
-    info = get_session_info(entries)
-    session_id = info["session_id"] or filepath.stem
+    text = extract_text_content(content, sidecar)
+    return text if text.strip() else None
 
-    # Generate output filename with date prefix
-    date_str = ""
-    if info["timestamp_start"]:
-        try:
-            dt = datetime.fromisoformat(info["timestamp_start"].replace("Z", "+00:00"))
-            date_str = dt.strftime("%Y-%m-%d_")
-        except ValueError:
-            pass
 
-    short_id = session_id[:8]
-    output_file = output_dir / f"{date_str}{short_id}.md"
+def format_entry(entry: dict, level: int = 2, sidecar=None) -> str:
+    """Render one session entry as a Markdown section, or None if it is skipped."""
+    text = entry_text(entry, sidecar)
+    if text is None:
+        return None
+
+    marks = "#" * level
+    if entry["type"] == "user":
+        if is_tool_results(entry.get("message", {}).get("content")):
+            # Only reachable with a sidecar: results follow the call, no heading
+            return f"{text}\n"
+        ts = format_timestamp(entry.get("timestamp", ""))
+        return f"{marks} User ({ts})\n\n{text}\n"
+
+    error = entry.get("error")
+    heading = f"{marks} Assistant (Error: {error})" if error else f"{marks} Assistant"
+    return f"{heading}\n\n{text}\n"
+
+
+def prompt_text(content) -> str:
+    """Plain text of a user message's content (string or text blocks)."""
+    if isinstance(content, str):
+        return content.strip()
+    if isinstance(content, list):
+        return "\n\n".join(b.get("text", "") for b in content if b.get("type") == "text").strip()
+    return ""
+
+
+def build_subagent_index(directory: Path) -> dict:
+    """Hash index of subagent sessions, built in one pass over directory.
+
+    Each agent-*.jsonl is read only up to its first user entry (the prompt).
+    Returns {"agents": {agent_id: path}, "prompts": {(session_id, prompt): path}}
+    so a parent's Task call can be joined by the agentId in its tool result,
+    or by (session id, prompt) for logs that predate agentId.
+    """
+    agents = {}
+    prompts = {}
+    for f in glob_sessions(directory, "agent-"):
+        agent_id = session_name(f)[len("agent-"):]
+        for entry in iter_entries(f, lazy=True):
+            if entry.get("type") == "user":
+                agent_id = entry.get("agentId") or agent_id
+                prompt = prompt_text(entry.get("message", {}).get("content"))
+                prompts[(entry.get("sessionId"), prompt)] = f
+                break
+        agents[agent_id] = f
+    return {"agents": agents, "prompts": prompts}
+
+
+def format_subagent(path: Path, description: str):
+    """Yield the Markdown for a subagent session, as a collapsible block."""
+    yield f"\n<details>\n<summary>Subagent: {description} (<code>{session_name(path)}</code>)</summary>\n"
+    for entry in iter_entries(path, lazy=True):
+        section = format_entry(entry, level=3)
+        if section is not None:
+            yield "\n" + section
+    yield "\n</details>\n"
+
 
+class SubagentStitcher:
+    """Joins a parent session's Task calls to the subagent sessions they spawned.
+
+    Task tool_use ids are remembered as the parent streams by (pending, a
+    small dict that survives incremental exports); when the matching
+    tool_result arrives, the subagent is looked up in the hash index and
+    rendered right after it. One dict lookup per tool call keeps stitching
+    linear in total log size.
+    """
+
+    def __init__(self, index: dict, pending: dict = None):
+        self.index = index
+        self.pending = pending if pending is not None else {}
+
+    def sections(self, entry: dict):
+        """Yield Markdown for subagents whose Task call completes in this entry."""
+        if not self.index or entry.get("type") not in ("user", "assistant"):
+            return
+        content = entry.get("message", {}).get("content")
+        if not isinstance(content, list):
+            return
+
+        if entry["type"] == "assistant":
+            for block in content:
+                if block.get("type") == "tool_use" and block.get("name") in SUBAGENT_TOOLS:
+                    tool_input = block.get("input", {})
+                    self.pending[block.get("id")] = [tool_input.get("description", "?"),
+                                                     (tool_input.get("prompt") or "").strip()]
+            return
+
+        result = entry.get("toolUseResult")
+        for block in content:
+            if block.get("type") != "tool_result" or block.get("tool_use_id") not in self.pending:
+                continue
+            description, prompt = self.pending.pop(block["tool_use_id"])
+            path = None
+            if isinstance(result, dict) and result.get("agentId"):
+                path = self.index["agents"].get(result["agentId"])
+            if path is None:
+                path = self.index["prompts"].get((entry.get("sessionId"), prompt))
+            if path is not None:
+                yield from format_subagent(path, description)
+
+
+def format_header(info: dict, session_id: str) -> str:
+    """Render the transcript header from completed session metadata."""
+    short_id = session_id[:8]
     lines = []
     lines.append(f"# Chat Transcript: {short_id}")
     lines.append("")
@@ -204,79 +691,979 @@ def export_session(filepath: Path, output_dir: Path, verbose: bool = False) -> P
     lines.append(f"**Messages:** {info['user_messages']} user, {info['assistant_messages']} assistant")
     lines.append("")
     lines.append("---")
-    lines.append("")
+    return "\n".join(lines) + "\n"
 
-    msg_num = 0
-    for entry in entries:
-        entry_type = entry.get("type")
 
-        if entry_type == "user":
-            content = entry.get("message", {}).get("content", "")
-            text = extract_text_content(content)
-            if not text.strip():
-                continue
-            # Skip pure tool_result entries (they clutter the transcript)
-            if isinstance(content, list) and all(b.get("type") == "tool_result" for b in content):
-                continue
-            msg_num += 1
-            ts = format_timestamp(entry.get("timestamp", ""))
-            lines.append(f"## User ({ts})")
-            lines.append("")
-            lines.append(text)
-            lines.append("")
-
-        elif entry_type == "assistant":
-            msg = entry.get("message", {})
-            content = msg.get("content", [])
-            text = extract_text_content(content)
-            if not text.strip():
-                continue
-            # Skip thinking-only blocks
-            if isinstance(content, list) and all(b.get("type") == "thinking" for b in content):
+def trie_pattern(words) -> str:
+    """Regex source matching any of words, factored into a prefix trie.
+
+    re tries alternatives one by one at each position; sharing prefixes
+    (and collapsing single-character tails into a class) makes each
+    position cost one branch per distinct next character instead of one
+    per word, the same walk an Aho-Corasick automaton does.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node):
+        if list(node) == [""]:
+            return ""
+        optional = "" in node
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        chars = [b for b in branches if len(b) == 1 or (len(b) == 2 and b[0] == "\\")]
+        if len(chars) > 1:
+            branches = [b for b in branches if b not in chars] + ["[" + "".join(chars) + "]"]
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")" + ("?" if optional else "")
+
+    return build(trie)
+
+
+class Redactor:
+    """Scrubs secrets and home-directory paths from rendered Markdown.
+
+    One combined trigger regex (trie_pattern over every rule's literals)
+    scans the text once; only at a trigger hit is that rule's full pattern
+    tried, so cost is linear in output size whatever the number of rules.
+    Scanned characters, time spent and hits per rule are accumulated for
+    the export summary. rules=() makes it a pass-through.
+    """
+
+    def __init__(self, rules=REDACTION_RULES):
+        self.rules = {}
+        for name, triggers, pattern, replacement in rules:
+            rule = (name, re.compile(pattern), replacement)
+            for trigger in triggers:
+                self.rules[trigger] = rule
+        self.triggers = re.compile(trie_pattern(self.rules)) if self.rules else None
+        self.fingerprint = hashlib.sha1(repr(rules).encode()).hexdigest()[:16] if rules else "off"
+        self.chars = 0
+        self.seconds = 0.0
+        self.hits = Counter()
+
+    def matches(self, text: str):
+        """Yield (rule name, match, replacement) for every secret in text, left to right."""
+        if self.triggers is None:
+            return
+        pos = 0
+        search = self.triggers.search
+        while True:
+            trigger = search(text, pos)
+            if trigger is None:
+                return
+            name, pattern, replacement = self.rules[trigger.group()]
+            at = trigger.start()
+            match = None
+            if name not in REDACTION_WORD_START or at == 0 or not text[at - 1].isalnum():
+                match = pattern.match(text, at)
+            if match is None:
+                pos = at + 1
                 continue
+            yield name, match, replacement
+            pos = match.end()
 
-            error = entry.get("error")
-            if error:
-                lines.append(f"## Assistant (Error: {error})")
-            else:
-                lines.append("## Assistant")
-            lines.append("")
-            lines.append(text)
-            lines.append("")
+    def __call__(self, text: str) -> str:
+        if self.triggers is None:
+            return text
+        start = time.perf_counter()
+        self.chars += len(text)
+        parts = []
+        done = 0
+        for name, match, replacement in self.matches(text):
+            parts.append(text[done:match.start()])
+            parts.append(match.expand(replacement))
+            self.hits[name] += 1
+            done = match.end()
+        if parts:
+            parts.append(text[done:])
+            text = "".join(parts)
+        self.seconds += time.perf_counter() - start
+        return text
+
+    def clip(self, text: str, limit: int) -> str:
+        """text[:limit], backed off to the start of any secret the cut would split.
+
+        Sections are redacted after rendering, so a secret cut in half by a
+        summary would no longer match its rule and its first part would leak.
+        """
+        for _, match, _ in self.matches(text):
+            if match.start() >= limit:
+                break
+            if match.end() > limit:
+                return text[:match.start()]
+        return text[:limit]
+
+    def stats(self) -> tuple:
+        return self.chars, self.seconds, dict(self.hits)
+
+
+# Locates secrets so summaries never truncate through one (used for clip() only)
+CLIP_GUARD = Redactor()
+
+
+def tail_signature(f, offset: int) -> str:
+    """Hash of the bytes just before offset, to detect rewritten (not appended) files."""
+    start = max(0, offset - SIGNATURE_BYTES)
+    f.seek(start)
+    return hashlib.sha1(f.read(offset - start)).hexdigest()
+
+
+def source_signature(filepath: Path, offset: int) -> str:
+    """tail_signature() of a plain session; size and mtime of a compressed one.
+
+    Archives are rewritten as a whole rather than appended to, and hashing
+    their tail would mean decompressing everything before it.
+    """
+    if is_compressed(filepath):
+        st = filepath.stat()
+        return f"{st.st_size}:{st.st_mtime_ns}"
+    with open(filepath, "rb") as f:
+        return tail_signature(f, offset)
+
+
+def load_export_state(conn: sqlite3.Connection, filepath: Path, output_dir: Path, redaction: str) -> dict:
+    """Saved export state for filepath, or None if it can't be resumed from.
+
+    redaction is the current Redactor fingerprint; an export written under
+    other rules (or with redaction off) is redone rather than appended to.
+    """
+    row = conn.execute("SELECT * FROM exports WHERE path = ? AND output_dir = ?",
+                       (str(filepath), str(output_dir.resolve()))).fetchone()
+    if row is None or row["redaction"] != redaction:
+        return None
+    output_file = Path(row["output_file"])
+    if not output_file.exists() or output_file.stat().st_size != row["output_size"]:
+        return None
+    if not is_compressed(filepath) and filepath.stat().st_size < row["offset"]:
+        return None
+    if source_signature(filepath, row["offset"]) != row["signature"]:
+        return None
+    state = dict(row)
+    state["info"] = json.loads(row["info"])
+    state["pending_tasks"] = json.loads(row["pending_tasks"])
+    state["output_file"] = output_file
+    return state
+
+
+def save_export_state(conn: sqlite3.Connection, filepath: Path, output_dir: Path, output_file: Path,
+                      offset: int, header_len: int, info: dict, pending_tasks: dict, redaction: str):
+    """Record where an export of filepath into output_dir left off."""
+    signature = source_signature(filepath, offset)
+    with conn:
+        conn.execute("INSERT OR REPLACE INTO exports VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                     (str(filepath), str(output_dir.resolve()), str(output_file), offset, signature,
+                      header_len, output_file.stat().st_size, json.dumps(info), json.dumps(pending_tasks),
+                      redaction))
+
+
+def write_full_export(filepath: Path, output_dir: Path, stitcher: SubagentStitcher, redact: Redactor) -> tuple:
+    """Stream a whole session to Markdown; returns (output_file, info, offset, header_len)."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    info = new_session_info()
+    seen = False
+
+    with tempfile.NamedTemporaryFile("w+", encoding="utf-8", dir=output_dir, prefix=".body-",
+                                     suffix=".md", buffering=WRITE_BUFFER, delete=False) as body:
+        try:
+            with open_session(filepath) as f:
+                reader = EntryReader(f, lazy=True)
+                for entry in reader:
+                    seen = True
+                    update_session_info(info, entry)
+                    section = format_entry(entry)
+                    if section is not None:
+                        body.write("\n")
+                        body.write(redact(section))
+                    for chunk in stitcher.sections(entry):
+                        body.write(redact(chunk))
+
+            if not seen:
+                return None, info, reader.offset, 0
+
+            session_id = info["session_id"] or session_name(filepath)
+
+            # Generate output filename with date prefix
+            date_str = ""
+            if info["timestamp_start"]:
+                try:
+                    dt = datetime.fromisoformat(info["timestamp_start"].replace("Z", "+00:00"))
+                    date_str = dt.strftime("%Y-%m-%d_")
+                except ValueError:
+                    pass
+
+            output_file = output_dir / f"{date_str}{session_id[:8]}.md"
+            header = format_header(info, session_id)
+
+            body.seek(0)
+            with open(output_file, "w", encoding="utf-8", buffering=WRITE_BUFFER) as out:
+                out.write(header)
+                shutil.copyfileobj(body, out, WRITE_BUFFER)
+        finally:
+            body.close()
+            os.unlink(body.name)
+
+    return output_file, info, reader.offset, len(header.encode("utf-8"))
 
+
+def append_export(filepath: Path, state: dict, stitcher: SubagentStitcher, redact: Redactor) -> tuple:
+    """Append sections for lines written since state["offset"]; returns (info, offset, header_len, added).
+
+    The header is rewritten in place when its length is unchanged (the usual
+    case: only counts and the end time move); otherwise the file is rebuilt
+    with the new header, which happens only when a count gains a digit.
+    """
+    info = state["info"]
+    output_file = state["output_file"]
+    added = 0
+
+    with open_session(filepath) as f, open(output_file, "r+b", buffering=WRITE_BUFFER) as out:
+        f.seek(state["offset"])
+        reader = EntryReader(f, lazy=True)
+        out.seek(0, os.SEEK_END)
+        for entry in reader:
+            update_session_info(info, entry)
+            section = format_entry(entry)
+            if section is not None:
+                out.write(("\n" + redact(section)).encode("utf-8"))
+                added += 1
+            for chunk in stitcher.sections(entry):
+                out.write(redact(chunk).encode("utf-8"))
+
+        header = format_header(info, info["session_id"] or session_name(filepath)).encode("utf-8")
+        if len(header) == state["header_len"]:
+            out.seek(0)
+            out.write(header)
+            return info, reader.offset, len(header), added
+
+        out.flush()
+        out.seek(state["header_len"])
+        with tempfile.NamedTemporaryFile("wb", dir=output_file.parent, prefix=".export-",
+                                         suffix=".md", delete=False) as rebuilt:
+            rebuilt.write(header)
+            shutil.copyfileobj(out, rebuilt, WRITE_BUFFER)
+    os.replace(rebuilt.name, output_file)
+    return info, reader.offset, len(header), added
+
+
+class PageWriter:
+    """Streams rendered sections into size-bounded Markdown pages.
+
+    A new page starts when the next section would push the current one past
+    page_bytes (a single larger section gets a page of its own). Each page
+    links back to the index and to its neighbours; tool outputs too long to
+    inline are written to results/ and linked, so they load only when opened.
+    Sections and results pass through redact on the way out.
+    """
+
+    def __init__(self, directory: Path, page_bytes: int, redact: Redactor):
+        self.directory = directory
+        self.page_bytes = page_bytes
+        self.redact = redact
+        self.pages = []  # [name, first_ts, last_ts, sections, bytes]
+        self.out = None
+        self.unnamed = 0
+        self.parts = {}  # tool_use_id -> sidecars written for it
+        (directory / "results").mkdir(parents=True)
+
+    def sidecar(self, tool_use_id: str, text: str) -> str:
+        """Store one oversized result part; later parts of the same result get -2, -3, ..."""
+        if not tool_use_id:
+            self.unnamed += 1
+            tool_use_id = f"result-{self.unnamed}"
+        name = re.sub(r"[^\w.-]", "_", tool_use_id)
+        part = self.parts[name] = self.parts.get(name, 0) + 1
+        if part > 1:
+            name = f"{name}-{part}"
+        (self.directory / "results" / f"{name}.txt").write_text(self.redact(text), encoding="utf-8")
+        return f"results/{name}.txt"
+
+    def start_page(self):
+        number = len(self.pages) + 1
+        name = f"page-{number:03d}.md"
+        if self.out is not None:
+            self.out.write(f"\n---\n\n[Index](index.md) · [Next →]({name})\n")
+            self.out.close()
+        self.out = open(self.directory / name, "w", encoding="utf-8", buffering=WRITE_BUFFER)
+        nav = "[Index](index.md)"
+        if number > 1:
+            nav = f"[← Previous]({self.pages[-1][0]}) · {nav}"
+        header = f"{nav}\n\n# Page {number}\n"
+        self.out.write(header)
+        self.pages.append([name, None, None, 0, len(header.encode("utf-8"))])
+
+    def write(self, section: str, timestamp: str = None):
+        section = self.redact(section)
+        size = len(section.encode("utf-8"))
+        page = self.pages[-1] if self.pages else None
+        if page is None or (page[3] and page[4] + size > self.page_bytes):
+            self.start_page()
+            page = self.pages[-1]
+        self.out.write(section)
+        page[3] += 1
+        page[4] += size
+        if timestamp:
+            page[1] = page[1] or timestamp
+            page[2] = timestamp
+
+    def close(self, header: str):
+        """Finish the last page and write index.md (session header + page table)."""
+        if self.out is not None:
+            self.out.write("\n---\n\n[Index](index.md)\n")
+            self.out.close()
+        lines = [header.rstrip("\n"), "", "| Page | From | To | Messages | Size |", "|------|------|----|----------|------|"]
+        for name, first_ts, last_ts, sections, size in self.pages:
+            lines.append(f"| [{name[:-3]}]({name}) | {format_timestamp(first_ts) if first_ts else '-'} "
+                         f"| {format_timestamp(last_ts) if last_ts else '-'} | {sections} | {size / 1024:.0f} KB |")
+        (self.directory / "index.md").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def write_paginated_export(filepath: Path, output_dir: Path, stitcher: SubagentStitcher, page_bytes: int,
+                           redact: Redactor) -> tuple:
+    """Stream a session into <date>_<id>/ as index.md + page-NNN.md + results/; returns (index, info)."""
     output_dir.mkdir(parents=True, exist_ok=True)
-    output_file.write_text("\n".join(lines), encoding="utf-8")
+    info = new_session_info()
+    seen = False
+    staging = Path(tempfile.mkdtemp(dir=output_dir, prefix=".pages-"))
+    try:
+        pages = PageWriter(staging, page_bytes, redact)
+        for entry in iter_entries(filepath, lazy=True):
+            seen = True
+            update_session_info(info, entry)
+            section = format_entry(entry, sidecar=pages.sidecar)
+            subagent = "".join(stitcher.sections(entry))
+            if section is not None or subagent:
+                pages.write("\n" + (section or "") + subagent, entry.get("timestamp"))
+        if not seen:
+            return None, info
+
+        session_id = info["session_id"] or session_name(filepath)
+        date_str = ""
+        if info["timestamp_start"]:
+            try:
+                dt = datetime.fromisoformat(info["timestamp_start"].replace("Z", "+00:00"))
+                date_str = dt.strftime("%Y-%m-%d_")
+            except ValueError:
+                pass
+        pages.close(format_header(info, session_id))
+
+        target = output_dir / f"{date_str}{session_id[:8]}"
+        if target.exists():
+            shutil.rmtree(target)
+        os.replace(staging, target)
+        return target / "index.md", info
+    finally:
+        if staging.exists():
+            shutil.rmtree(staging)
+
+
+def export_session(filepath: Path, output_dir: Path, verbose: bool = False, incremental: bool = False,
+                   subagents: dict = None, page_bytes: int = None, redact: Redactor = None) -> Path:
+    """Export a single session JSONL to Markdown.
+
+    Single pass with memory independent of session size: entries are parsed
+    lazily, metadata is accumulated as they go by, and rendered sections are
+    streamed to a temporary body file. The header (which needs the final
+    counts and end timestamp) is written last, followed by the body.
+
+    With incremental=True the byte offset and running metadata are saved in
+    the session index, and later calls only parse lines appended since then
+    and append their sections to the existing Markdown.
+
+    subagents is a build_subagent_index() result; Task calls found in it get
+    the subagent's transcript rendered inline.
+
+    page_bytes switches to paginated output (always a full export): a
+    directory with an index page and pages of at most ~page_bytes each.
+
+    redact scrubs secrets and home paths from everything written (default:
+    a Redactor with REDACTION_RULES; Redactor(()) exports verbatim).
+    """
+    if redact is None:
+        redact = Redactor()
+    if page_bytes:
+        index_file, info = write_paginated_export(filepath, output_dir, SubagentStitcher(subagents), page_bytes,
+                                                  redact)
+        if index_file is not None and verbose:
+            pages = len(list(index_file.parent.glob("page-*.md")))
+            print(f"  Exported: {index_file.parent.name}/ ({pages} pages, {info['user_messages']} user msgs, "
+                  f"{info['assistant_messages']} assistant msgs)")
+        return index_file
+
+    conn = open_index() if incremental else None
+    try:
+        state = load_export_state(conn, filepath, output_dir, redact.fingerprint) if conn else None
+        if state is not None:
+            if is_compressed(filepath) or filepath.stat().st_size == state["offset"]:
+                return state["output_file"]
+            stitcher = SubagentStitcher(subagents, state["pending_tasks"])
+            info, offset, header_len, added = append_export(filepath, state, stitcher, redact)
+            output_file = state["output_file"]
+            if offset == state["offset"]:
+                # Only a partially written line so far
+                return output_file
+            message = f"  Appended: {output_file.name} (+{added} msgs, {offset - state['offset']} new bytes)"
+        else:
+            stitcher = SubagentStitcher(subagents)
+            output_file, info, offset, header_len = write_full_export(filepath, output_dir, stitcher, redact)
+            if output_file is None:
+                return None
+            message = (f"  Exported: {output_file.name} ({info['user_messages']} user msgs, "
+                       f"{info['assistant_messages']} assistant msgs)")
+        if conn:
+            save_export_state(conn, filepath, output_dir, output_file, offset, header_len, info, stitcher.pending,
+                              redact.fingerprint)
+    finally:
+        if conn:
+            conn.close()
 
     if verbose:
-        print(f"  Exported: {output_file.name} ({info['user_messages']} user msgs, {info['assistant_messages']} assistant msgs)")
+        print(message)
 
     return output_file
 
 
-def list_sessions():
-    """List all available sessions with metadata."""
-    if not TRANSCRIPTS_PATH.exists():
-        print(f"No transcripts found at {TRANSCRIPTS_PATH}")
+def export_job(job: tuple) -> tuple:
+    """Export one session, isolating failures: returns (output_file, report, error, timing).
+
+    Progress output is captured rather than printed so the parent can report
+    sessions in submission order regardless of which worker finishes first.
+    timing is (export seconds, redacted chars, redaction seconds, hits per rule).
+    """
+    filepath, output_dir, incremental, subagents, page_bytes, redact = job
+    redactor = Redactor() if redact else Redactor(())
+    report = io.StringIO()
+    start = time.perf_counter()
+    try:
+        with redirect_stdout(report):
+            output_file = export_session(filepath, output_dir, verbose=True, incremental=incremental,
+                                         subagents=subagents, page_bytes=page_bytes, redact=redactor)
+    except Exception as e:
+        detail = traceback.format_exception_only(type(e), e)[-1].strip()
+        output_file, error = None, f"  FAILED: {filepath.name} ({detail})"
+    else:
+        error = None
+    return output_file, report.getvalue(), error, (time.perf_counter() - start,) + redactor.stats()
+
+
+def export_sessions(files: list[Path], output_dir: Path, jobs: int = 1, incremental: bool = True,
+                    page_bytes: int = None, redact: bool = True) -> tuple:
+    """Export files (on a process pool if jobs > 1); returns (exported, failed, timing).
+
+    timing sums export_job()'s per-session timings: (export seconds, redacted
+    chars, redaction seconds, hits per rule).
+    """
+    subagents = {"agents": {}, "prompts": {}}
+    for directory in {f.parent for f in files}:
+        index = build_subagent_index(directory)
+        subagents["agents"].update(index["agents"])
+        subagents["prompts"].update(index["prompts"])
+    work = [(f, output_dir, incremental, subagents, page_bytes, redact) for f in files]
+    counts = [0, 0]
+    timing = [0.0, 0, 0.0, Counter()]
+
+    def tally(results):
+        for output_file, report, error, (seconds, chars, redact_seconds, hits) in results:
+            timing[0] += seconds
+            timing[1] += chars
+            timing[2] += redact_seconds
+            timing[3].update(hits)
+            sys.stdout.write(report)
+            if error:
+                print(error)
+                counts[1] += 1
+            elif output_file:
+                counts[0] += 1
+
+    if jobs > 1 and len(work) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(work))) as pool:
+            tally(pool.map(export_job, work, chunksize=1))
+    else:
+        tally(map(export_job, work))
+    return counts[0], counts[1], tuple(timing)
+
+
+def redaction_summary(timing: tuple) -> str:
+    """One-line report of what was redacted and what the scan cost."""
+    seconds, chars, redact_seconds, hits = timing
+    found = ", ".join(f"{count} {name}" for name, count in hits.most_common()) or "nothing found"
+    rate = chars / redact_seconds / 1e6 if redact_seconds else 0.0
+    share = 100 * redact_seconds / seconds if seconds else 0.0
+    return (f"Redacted: {found} ({chars / 1e6:.1f}M chars scanned at {rate:.0f}M/s, "
+            f"{share:.1f}% of export time)")
+
+
+def watch_sessions(select_files, output_dir: Path, jobs: int = 1, interval: float = WATCH_INTERVAL,
+                   page_bytes: int = None, redact: bool = True):
+    """Poll the selected sessions and append new lines to their exports until interrupted.
+
+    Each tick only stat()s unchanged sessions; growing ones parse just their
+    new bytes, so the cost is proportional to what was written since.
+    Paginated exports cannot be appended to, so with page_bytes a session
+    is re-exported in full, and only on ticks where its size or mtime changed.
+    """
+    print(f"Watching for new transcript lines every {interval:g}s (Ctrl-C to stop)\n")
+    seen = {}
+    try:
+        while True:
+            files = select_files()
+            if page_bytes:
+                stats = {f: f.stat() for f in files}
+                files = [f for f in files if seen.get(f) != (stats[f].st_size, stats[f].st_mtime_ns)]
+                seen.update((f, (stats[f].st_size, stats[f].st_mtime_ns)) for f in files)
+            if files:
+                export_sessions(files, output_dir, jobs, page_bytes=page_bytes, redact=redact)
+            sys.stdout.flush()
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+
+
+def find_projects(root: Path = PROJECTS_ROOT, pattern: str = PROJECT_PATTERN) -> list[Path]:
+    """Transcript directories under root whose name matches the glob pattern."""
+    if not root.is_dir():
+        return []
+    return sorted(d for d in root.glob(pattern) if d.is_dir())
+
+
+def scan_project(directory: Path, agents: bool = False) -> list[tuple]:
+    """(mtime_ns, path) of a project's session files, newest first."""
+    scanned = [(f.stat().st_mtime_ns, f) for f in glob_sessions(directory)
+               if agents or not session_name(f).startswith("agent-")]
+    scanned.sort(reverse=True)
+    return scanned
+
+
+def session_files(projects: list[Path] = None, agents: bool = False) -> list[Path]:
+    """Session files (plain or compressed) of all projects, newest first.
+
+    Project directories are listed and stat()ed on a thread pool (the work
+    is filesystem calls, which release the GIL) and the per-project lists,
+    each already newest first, are merged. Agent subprocesses are skipped
+    unless agents=True. Nothing is opened here: callers that need metadata
+    go through the index, which re-parses only new or changed files.
+    """
+    if projects is None:
+        projects = find_projects()
+    if len(projects) <= 1:
+        scans = [scan_project(d, agents) for d in projects]
+    else:
+        with ThreadPoolExecutor(max_workers=min(SCAN_THREADS, len(projects))) as pool:
+            scans = list(pool.map(scan_project, projects, [agents] * len(projects)))
+    return [f for _, f in heapq.merge(*scans, reverse=True)]
+
+
+def open_index(index_file: Path = INDEX_FILE, rebuild: bool = False) -> sqlite3.Connection:
+    """Open (creating or migrating as needed) the session metadata index."""
+    index_file.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(index_file)
+    conn.row_factory = sqlite3.Row
+    if rebuild or conn.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+        for table in INDEX_TABLES:
+            conn.execute(f"DROP TABLE IF EXISTS {table}")
+    for statement in INDEX_SCHEMA:
+        conn.execute(statement)
+    conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+    return conn
+
+
+def refresh_index(conn: sqlite3.Connection, files: list[Path]) -> list[dict]:
+    """Bring the index in line with files and return their metadata in the same order.
+
+    Each file is stat()ed; only files whose (size, mtime) differ from the
+    stored row are parsed. Rows for files that no longer exist are dropped.
+    """
+    stored = {row["path"]: row for row in conn.execute("SELECT * FROM sessions")}
+    infos = []
+    changed = []
+    for f in files:
+        st = f.stat()
+        row = stored.pop(str(f), None)
+        if row is not None and row["size"] == st.st_size and row["mtime_ns"] == st.st_mtime_ns:
+            info = {field: row[field] for field in INDEX_FIELDS}
+        else:
+            info = get_session_info(iter_entries(f, lazy=True))
+            changed.append((str(f), st.st_size, st.st_mtime_ns) + tuple(info[field] for field in INDEX_FIELDS))
+        info["path"] = f
+        infos.append(info)
+
+    with conn:
+        placeholders = ", ".join("?" * (3 + len(INDEX_FIELDS)))
+        conn.executemany(f"INSERT OR REPLACE INTO sessions VALUES ({placeholders})", changed)
+        conn.executemany("DELETE FROM sessions WHERE path = ?", [(path,) for path in stored])
+    return infos
+
+
+def load_index(projects: list[Path], rebuild: bool = False, files: list[Path] = None) -> list[dict]:
+    """Metadata for every session file of projects, newest first, via the SQLite index.
+
+    files, if given, is an already scanned session_files(projects) list.
+    """
+    conn = open_index(rebuild=rebuild)
+    try:
+        return refresh_index(conn, session_files(projects) if files is None else files)
+    finally:
+        conn.close()
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-cased word tokens (2+ characters) used for indexing and queries."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def index_session_text(conn: sqlite3.Connection, filepath: Path):
+    """(Re)build the search postings for one session file."""
+    path = str(filepath)
+    conn.execute("DELETE FROM postings WHERE message_id IN (SELECT id FROM messages WHERE path = ?)", (path,))
+    conn.execute("DELETE FROM messages WHERE path = ?", (path,))
+
+    msg_no = 0
+    for entry in iter_entries(filepath, lazy=True):
+        text = entry_text(entry)
+        if text is None:
+            continue
+        msg_no += 1
+        terms = Counter(tokenize(text))
+        cursor = conn.execute(
+            "INSERT INTO messages (path, session_id, msg_no, role, timestamp, length, text) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (path, entry.get("sessionId") or session_name(filepath), msg_no, entry["type"],
+             entry.get("timestamp"), sum(terms.values()), text),
+        )
+        conn.executemany("INSERT INTO postings VALUES (?, ?, ?)",
+                         [(term, cursor.lastrowid, tf) for term, tf in terms.items()])
+
+
+def refresh_search_index(conn: sqlite3.Connection, files: list[Path]) -> int:
+    """Re-index only new or changed session files; returns how many were parsed."""
+    stored = {row["path"]: (row["size"], row["mtime_ns"]) for row in conn.execute("SELECT * FROM search_files")}
+    parsed = 0
+    for f in files:
+        st = f.stat()
+        if stored.pop(str(f), None) == (st.st_size, st.st_mtime_ns):
+            continue
+        with conn:
+            index_session_text(conn, f)
+            conn.execute("INSERT OR REPLACE INTO search_files VALUES (?, ?, ?)", (str(f), st.st_size, st.st_mtime_ns))
+        parsed += 1
+
+    with conn:
+        for path in stored:
+            conn.execute("DELETE FROM postings WHERE message_id IN (SELECT id FROM messages WHERE path = ?)", (path,))
+            conn.execute("DELETE FROM messages WHERE path = ?", (path,))
+            conn.execute("DELETE FROM search_files WHERE path = ?", (path,))
+    return parsed
+
+
+def search_messages(conn: sqlite3.Connection, query: str, limit: int = 20) -> list[dict]:
+    """Messages containing every query term, ranked by BM25 (best first)."""
+    terms = sorted(set(tokenize(query)))
+    if not terms:
+        return []
+
+    total, avg_length = conn.execute("SELECT COUNT(*), AVG(length) FROM messages").fetchone()
+    scores = None
+    for term in terms:
+        postings = conn.execute("SELECT message_id, tf FROM postings WHERE term = ?", (term,)).fetchall()
+        idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+        term_scores = {message_id: (idf, tf) for message_id, tf in postings}
+        if scores is None:
+            scores = {message_id: [value] for message_id, value in term_scores.items()}
+        else:
+            scores = {message_id: parts + [term_scores[message_id]]
+                      for message_id, parts in scores.items() if message_id in term_scores}
+        if not scores:
+            return []
+
+    hits = []
+    ids = list(scores)
+    for start in range(0, len(ids), 500):
+        chunk = ids[start:start + 500]
+        rows = conn.execute(
+            f"SELECT * FROM messages WHERE id IN ({', '.join('?' * len(chunk))})", chunk
+        ).fetchall()
+        for row in rows:
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * row["length"] / (avg_length or 1))
+            score = sum(idf * tf * (BM25_K1 + 1) / (tf + norm) for idf, tf in scores[row["id"]])
+            hits.append(dict(row, score=score))
+
+    hits.sort(key=lambda hit: (-hit["score"], hit["timestamp"] or ""))
+    return hits[:limit]
+
+
+def snippet(text: str, terms: list[str]) -> str:
+    """One-line excerpt of text around the first occurrence of any term."""
+    lower = text.lower()
+    positions = [pos for pos in (lower.find(term) for term in terms) if pos >= 0]
+    pos = min(positions) if positions else 0
+    start = max(0, pos - SNIPPET_CHARS)
+    excerpt = " ".join(text[start:pos + SNIPPET_CHARS].split())
+    return ("..." if start else "") + excerpt + ("..." if pos + SNIPPET_CHARS < len(text) else "")
+
+
+def search_transcripts(projects: list[Path], query: str, limit: int = 20, rebuild: bool = False):
+    """Print ranked session / message hits for query."""
+    conn = open_index(rebuild=rebuild)
+    try:
+        parsed = refresh_search_index(conn, session_files(projects))
+        start = time.perf_counter()
+        hits = search_messages(conn, query, limit)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+    finally:
+        conn.close()
+
+    if parsed:
+        print(f"Indexed {parsed} new or changed session(s)")
+    if not hits:
+        print(f"No messages matching '{query}' ({elapsed_ms:.1f} ms)")
         return
 
-    files = sorted(TRANSCRIPTS_PATH.glob("*.jsonl"), key=lambda f: f.stat().st_mtime, reverse=True)
-    if not files:
+    sessions = {}
+    for hit in hits:
+        sessions.setdefault(hit["session_id"], []).append(hit)
+    print(f"{len(hits)} hit(s) in {len(sessions)} session(s) for '{query}' ({elapsed_ms:.1f} ms)\n")
+
+    terms = tokenize(query)
+    for session_id, session_hits in sessions.items():
+        print(f"{session_id}  (best score {session_hits[0]['score']:.2f}, {len(session_hits)} hit(s))")
+        for hit in session_hits:
+            ts = format_timestamp_ms(hit["timestamp"])
+            print(f"  #{hit['msg_no']:<5} {ts:<27} {hit['role']:<9} {hit['score']:6.2f}  {snippet(hit['text'], terms)}")
+        print()
+
+
+def load_numpy():
+    """Import NumPy for --stats, installing it on first use like the generate_* scripts."""
+    try:
+        import numpy as np
+    except ImportError:
+        print("Installing numpy...")
+        import subprocess
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "numpy", "-q"])
+        import numpy as np
+    return np
+
+
+def timestamp_ms(ts_str: str) -> int:
+    """Milliseconds since the epoch for an ISO timestamp, or -1."""
+    try:
+        return int(datetime.fromisoformat(ts_str.replace("Z", "+00:00")).timestamp() * 1000)
+    except (ValueError, AttributeError):
+        return -1
+
+
+def content_chars(content) -> int:
+    """Size in characters of message / tool_result content."""
+    if isinstance(content, str):
+        return len(content)
+    if isinstance(content, list):
+        return sum(content_chars(b.get("text") or b.get("content") or b.get("thinking") or "")
+                   for b in content if isinstance(b, dict))
+    return 0
+
+
+def extract_usage_records(filepath: Path) -> tuple:
+    """Stream one session into (messages, tools) row lists for the columnar store.
+
+    messages: (timestamp_ms, role, chars); role 0 = user, 1 = assistant.
+    tools: (name, start_ms, latency_ms, output_chars, is_error); latency is
+    tool_use -> tool_result time, -1 if the result never arrived.
+    """
+    messages = []
+    tools = []
+    open_calls = {}
+    for entry in iter_entries(filepath, lazy=True):
+        entry_type = entry.get("type")
+        if entry_type not in ("user", "assistant"):
+            continue
+        ts = timestamp_ms(entry.get("timestamp"))
+        content = entry.get("message", {}).get("content")
+        messages.append((ts, 0 if entry_type == "user" else 1, content_chars(content)))
+        if not isinstance(content, list):
+            continue
+        for block in content:
+            btype = block.get("type")
+            if btype == "tool_use":
+                row = [block.get("name", "unknown"), ts, -1, 0, False]
+                open_calls[block.get("id")] = row
+                tools.append(row)
+            elif btype == "tool_result":
+                row = open_calls.pop(block.get("tool_use_id"), None)
+                if row is not None:
+                    row[2] = ts - row[1] if ts >= 0 and row[1] >= 0 else -1
+                    row[3] = content_chars(block.get("content"))
+                    row[4] = bool(block.get("is_error"))
+    return messages, tools
+
+
+def build_analytics(files: list[Path], store: Path = ANALYTICS_FILE) -> dict:
+    """Columnar usage records for files, re-extracting only new or changed sessions.
+
+    The store is a NumPy .npz of parallel arrays: per-session path / size /
+    mtime, per-message msg_* columns and per-tool-call tool_* columns, each
+    row tagged with its session index. Tool names are dictionary-encoded.
+    """
+    np = load_numpy()
+    old = dict(np.load(store)) if store.exists() else None
+    stats = [(str(f), f.stat()) for f in files]
+
+    keep = {}
+    if old is not None:
+        known = {path: i for i, path in enumerate(old["session_path"].tolist())}
+        for new_idx, (path, st) in enumerate(stats):
+            i = known.get(path)
+            if i is not None and old["session_size"][i] == st.st_size and old["session_mtime"][i] == st.st_mtime_ns:
+                keep[i] = new_idx
+
+    names = list(old["tool_names"]) if old is not None else []
+    name_codes = {name: code for code, name in enumerate(names)}
+    columns = {key: [] for key in ("msg_session", "msg_ts", "msg_role", "msg_chars", "tool_session",
+                                   "tool_name", "tool_start", "tool_latency", "tool_chars", "tool_error")}
+
+    if keep:
+        # Carry over rows of unchanged sessions, renumbering their session index
+        remap = np.full(len(old["session_path"]), -1, dtype=np.int32)
+        remap[list(keep)] = list(keep.values())
+        for prefix in ("msg", "tool"):
+            mask = remap[old[f"{prefix}_session"]] >= 0
+            for key in columns:
+                if key.startswith(prefix + "_"):
+                    values = old[key][mask]
+                    columns[key].append(remap[values] if key.endswith("_session") else values)
+
+    kept = set(keep.values())
+    for idx, (path, _) in enumerate(stats):
+        if idx in kept:
+            continue
+        messages, tools = extract_usage_records(Path(path))
+        if messages:
+            ts, role, chars = zip(*messages)
+            columns["msg_session"].append(np.full(len(messages), idx, dtype=np.int32))
+            columns["msg_ts"].append(np.array(ts, dtype=np.int64))
+            columns["msg_role"].append(np.array(role, dtype=np.uint8))
+            columns["msg_chars"].append(np.array(chars, dtype=np.int32))
+        if tools:
+            name, start, latency, out_chars, error = zip(*tools)
+            columns["tool_session"].append(np.full(len(tools), idx, dtype=np.int32))
+            columns["tool_name"].append(np.array([name_codes.setdefault(n, len(name_codes)) for n in name],
+                                                 dtype=np.int16))
+            columns["tool_start"].append(np.array(start, dtype=np.int64))
+            columns["tool_latency"].append(np.array(latency, dtype=np.int64))
+            columns["tool_chars"].append(np.array(out_chars, dtype=np.int32))
+            columns["tool_error"].append(np.array(error, dtype=bool))
+
+    dtypes = {"session": np.int32, "ts": np.int64, "role": np.uint8, "chars": np.int32, "name": np.int16,
+              "start": np.int64, "latency": np.int64, "error": bool}
+    data = {key: np.concatenate(parts) if parts else np.zeros(0, dtype=dtypes[key.split("_", 1)[1]])
+            for key, parts in columns.items()}
+    data["tool_names"] = np.array(sorted(name_codes, key=name_codes.get), dtype=str)
+    data["session_path"] = np.array([path for path, _ in stats], dtype=str)
+    data["session_size"] = np.array([st.st_size for _, st in stats], dtype=np.int64)
+    data["session_mtime"] = np.array([st.st_mtime_ns for _, st in stats], dtype=np.int64)
+
+    if len(keep) != len(stats) or old is None or len(old["session_path"]) != len(stats):
+        store.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("wb", dir=store.parent, suffix=".npz", delete=False) as tmp:
+            np.savez(tmp, **data)
+        os.replace(tmp.name, store)
+    return data
+
+
+def usage_report(data: dict, top: int = 10) -> list[str]:
+    """Aggregate reports over the columnar store, as vectorized NumPy queries."""
+    np = load_numpy()
+    lines = []
+    names = data["tool_names"]
+    sessions = [session_name(Path(p)) for p in data["session_path"]]
+
+    # Tool latency percentiles (completed calls only), slowest median first
+    done = data["tool_latency"] >= 0
+    codes = data["tool_name"][done]
+    latency = data["tool_latency"][done] / 1000
+    order = np.argsort(codes, kind="stable")
+    codes, latency = codes[order], latency[order]
+    uniq, starts, counts = np.unique(codes, return_index=True, return_counts=True)
+    rows = []
+    for code, start, count in zip(uniq, starts, counts):
+        p50, p90, p99 = np.percentile(latency[start:start + count], [50, 90, 99])
+        errors = int(data["tool_error"][data["tool_name"] == code].sum())
+        rows.append((p50, names[code], count, p90, p99, errors))
+    lines.append(f"Tool latency (s) over {int(done.sum())} completed calls")
+    lines.append(f"  {'Tool':<20} {'Calls':>7} {'p50':>8} {'p90':>8} {'p99':>8} {'Errors':>7}")
+    for p50, name, count, p90, p99, errors in sorted(rows, key=lambda r: r[0], reverse=True)[:top]:
+        lines.append(f"  {name:<20} {count:>7} {p50:>8.2f} {p90:>8.2f} {p99:>8.2f} {errors:>7}")
+
+    # Busiest days by message count (UTC), with tool calls per day
+    stamped = data["msg_ts"] >= 0
+    days, msg_counts = np.unique(data["msg_ts"][stamped] // MS_PER_DAY, return_counts=True)
+    tool_days = data["tool_start"][data["tool_start"] >= 0] // MS_PER_DAY
+    tool_counts = np.searchsorted(np.sort(tool_days), days, side="right") - np.searchsorted(np.sort(tool_days), days)
+    busiest = np.lexsort((days, -msg_counts))[:top]
+    lines.append("")
+    lines.append(f"Busiest days ({len(days)} active)")
+    for i in busiest:
+        day = datetime.fromtimestamp(int(days[i]) * MS_PER_DAY / 1000, timezone.utc).strftime("%Y-%m-%d")
+        lines.append(f"  {day}  {msg_counts[i]:>7} messages  {tool_counts[i]:>6} tool calls")
+
+    # Largest tool outputs
+    sizes = data["tool_chars"]
+    # Ties broken by session (indexed in path order) and start time, so the order doesn't depend on store layout
+    largest = np.lexsort((data["tool_start"], data["tool_session"], -sizes.astype(np.int64)))[:top]
+    lines.append("")
+    lines.append("Largest tool outputs")
+    for i in largest:
+        if sizes[i] == 0:
+            break
+        ts = data["tool_start"][i]
+        when = datetime.fromtimestamp(ts / 1000, timezone.utc).strftime("%Y-%m-%d %H:%M:%S") if ts >= 0 else "Unknown"
+        lines.append(f"  {sizes[i]:>10,} chars  {names[data['tool_name'][i]]:<16} {when}  {sessions[data['tool_session'][i]]}")
+    return lines
+
+
+def show_stats(projects: list[Path], top: int = 10):
+    """Print usage analytics over every session (including subagents)."""
+    files = session_files(projects, agents=True)
+
+    start = time.perf_counter()
+    data = build_analytics(files)
+    loaded = time.perf_counter()
+    report = usage_report(data, top)
+    done = time.perf_counter()
+
+    print(f"{len(files)} session(s), {len(data['msg_ts'])} messages, {len(data['tool_name'])} tool calls\n")
+    print("\n".join(report))
+    print(f"\nStore refresh {(loaded - start) * 1000:.0f} ms, queries {(done - loaded) * 1000:.1f} ms")
+
+
+def find_sessions(infos: list[dict], query: str) -> list[dict]:
+    """Sessions whose file name or session ID contains query."""
+    return [info for info in infos if query in session_name(info["path"]) or query in (info["session_id"] or "")]
+
+
+def list_sessions(projects: list[Path], rebuild: bool = False):
+    """List the sessions of all projects with metadata, newest first."""
+    infos = load_index(projects, rebuild)
+    if not infos:
         print("No JSONL files found.")
         return
 
-    print(f"Found {len(files)} session(s) in {TRANSCRIPTS_PATH}\n")
+    if len(projects) == 1:
+        print(f"Found {len(infos)} session(s) in {projects[0]}\n")
+    else:
+        print(f"Found {len(infos)} session(s) in {len(projects)} projects under {projects[0].parent}:")
+        for project in projects:
+            print(f"  {project.name}")
+        print()
     print(f"{'#':<4} {'Session ID':<40} {'Date':<22} {'User Msgs':<10} {'First Message'}")
     print("-" * 120)
 
-    for i, f in enumerate(files, 1):
-        # Skip agent subprocesses
-        if f.stem.startswith("agent-"):
-            continue
-        entries = load_session(f)
-        info = get_session_info(entries)
+    for i, info in enumerate(infos, 1):
         date = format_timestamp(info["timestamp_start"])[:19] if info["timestamp_start"] else "Unknown"
         first = info["first_user_message"][:50]
-        print(f"{i:<4} {(info['session_id'] or f.stem):<40} {date:<22} {info['user_messages']:<10} {first}")
+        print(f"{i:<4} {(info['session_id'] or session_name(info['path'])):<40} {date:<22} {info['user_messages']:<10} {first}")
 
 
 def main():
@@ -286,50 +1673,96 @@ def main():
     parser.add_argument("--list", action="store_true", help="List available sessions")
     parser.add_argument("--all", action="store_true", help="Export all sessions")
     parser.add_argument("--output", type=str, metavar="DIR", help="Output directory (default: Docs/ChatTranscripts/)")
+    parser.add_argument("--jobs", type=int, default=1, metavar="N", help="Export sessions on N worker processes (default: 1)")
+    parser.add_argument("--range", type=parse_range, metavar="A:B",
+                        help="With --session: print only JSONL lines A..B-1 (via a memory-mapped line index)")
+    parser.add_argument("--paginate", action="store_true",
+                        help="Write each session as an index page plus size-bounded pages, with long tool outputs in results/")
+    parser.add_argument("--page-size", type=int, default=PAGE_KB, metavar="KB",
+                        help=f"Target page size for --paginate (default: {PAGE_KB} KB)")
+    parser.add_argument("--full", action="store_true", help="Re-export from scratch instead of appending new lines")
+    parser.add_argument("--watch", action="store_true", help="Keep exporting new lines as the selected sessions grow")
+    parser.add_argument("--interval", type=float, default=WATCH_INTERVAL, metavar="SEC",
+                        help=f"--watch polling interval (default: {WATCH_INTERVAL:g}s)")
+    parser.add_argument("--no-redact", action="store_true",
+                        help="Keep secrets and home-directory paths in the exported Markdown")
+    parser.add_argument("--stats", action="store_true", help="Usage analytics across all sessions")
+    parser.add_argument("--search", type=str, metavar="QUERY", help="Full-text search of user / assistant messages")
+    parser.add_argument("--limit", type=int, default=20, metavar="N",
+                        help="Maximum --search hits / rows per --stats report (default: 20)")
+    parser.add_argument("--reindex", action="store_true", help="Rebuild the session metadata index from scratch")
+    parser.add_argument("--projects-root", type=str, default=str(PROJECTS_ROOT), metavar="DIR",
+                        help="Directory holding per-project transcript directories (default: ~/.claude/projects)")
+    parser.add_argument("--project", type=str, default=PROJECT_PATTERN, metavar="GLOB",
+                        help=f"Project directories to read, as a glob (default: '{PROJECT_PATTERN}')")
     args = parser.parse_args()
 
+    projects = find_projects(Path(args.projects_root).expanduser(), args.project)
+    if not projects:
+        print(f"Error: No transcript directories matching '{args.project}' found in {args.projects_root}")
+        sys.exit(1)
+
     if args.list:
-        list_sessions()
+        list_sessions(projects, args.reindex)
         return
 
-    output_dir = Path(args.output) if args.output else OUTPUT_DIR
+    if args.search:
+        search_transcripts(projects, args.search, args.limit, args.reindex)
+        return
 
-    if not TRANSCRIPTS_PATH.exists():
-        print(f"Error: No transcripts directory found at {TRANSCRIPTS_PATH}")
-        sys.exit(1)
+    if args.stats:
+        show_stats(projects, args.limit)
+        return
+
+    output_dir = Path(args.output) if args.output else OUTPUT_DIR
 
-    # Collect session files (skip agent subprocesses)
-    all_files = sorted(
-        [f for f in TRANSCRIPTS_PATH.glob("*.jsonl") if not f.stem.startswith("agent-")],
-        key=lambda f: f.stat().st_mtime,
-        reverse=True,
-    )
+    def select_files(rebuild=False, all_files=None):
+        # Collect session files (skip agent subprocesses); --watch rescans on every call
+        if all_files is None:
+            all_files = session_files(projects)
+        if args.session:
+            return [info["path"] for info in find_sessions(load_index(projects, rebuild, all_files), args.session)]
+        if args.latest:
+            return all_files[: args.latest]
+        if args.all:
+            return all_files
+        # Default: export latest 5
+        return all_files[:5]
 
+    all_files = session_files(projects)
     if not all_files:
         print("No session files found.")
         sys.exit(1)
 
-    if args.session:
-        files = [f for f in all_files if args.session in f.stem]
-        if not files:
-            print(f"No session matching '{args.session}' found.")
-            sys.exit(1)
-    elif args.latest:
-        files = all_files[: args.latest]
-    elif args.all:
-        files = all_files
-    else:
-        # Default: export latest 5
-        files = all_files[:5]
+    files = select_files(args.reindex, all_files)
+    if args.session and not files:
+        print(f"No session matching '{args.session}' found.")
+        sys.exit(1)
+
+    if args.range:
+        if not args.session:
+            parser.error("--range requires --session")
+        if len(files) > 1:
+            print(f"'{args.session}' matches {len(files)} sessions; using the most recent ({session_name(files[0])})\n")
+        print_entry_range(files[0], args.range)
+        return
+    if not (args.session or args.latest or args.all):
         print(f"Exporting {len(files)} most recent sessions (use --all for everything, --list to browse)\n")
 
-    exported = 0
-    for f in files:
-        result = export_session(f, output_dir, verbose=True)
-        if result:
-            exported += 1
+    page_bytes = args.page_size * 1024 if args.paginate else None
+    if args.watch:
+        watch_sessions(select_files, output_dir, args.jobs, args.interval, page_bytes, redact=not args.no_redact)
+        return
+
+    exported, failed, timing = export_sessions(files, output_dir, args.jobs, incremental=not args.full,
+                                               page_bytes=page_bytes, redact=not args.no_redact)
 
     print(f"\nExported {exported} transcript(s) to {output_dir}/")
+    if not args.no_redact and timing[1]:
+        print(redaction_summary(timing))
+    if failed:
+        print(f"{failed} session(s) failed to export")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -1,20 +1,45 @@
 #!/usr/bin/env python3
 """
 App Icon Generator for Starship Lander
-Generates a 1024x1024 app icon featuring a SpaceX Starship design
+Generates the AppIcon set featuring a SpaceX Starship design
+
+Renders one supersampled master, downsamples it in parallel to every size the
+AppIcon.appiconset needs, and writes the matching Contents.json. Dark and
+tinted appearances are recolored from the same rendered layers, not redrawn. Nothing is
+written when the master is unchanged since the last run (use --force to override).
+
+Usage:
+    python3 generate_icon.py            # Regenerate if the master changed
+    python3 generate_icon.py --force    # Always rewrite all sizes
+    python3 generate_icon.py --sweep flame_height=80:200:8 earth_x=0.7:0.9:5   # Contact sheet
 """
 
+import os
 import sys
+import json
 import math
 import random
+import hashlib
+import argparse
+import itertools
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 try:
-    from PIL import Image, ImageDraw
+    from PIL import Image, ImageDraw, ImageFont
 except ImportError:
     print("Installing Pillow...")
     import subprocess
     subprocess.check_call([sys.executable, "-m", "pip", "install", "Pillow", "-q"])
-    from PIL import Image, ImageDraw
+    from PIL import Image, ImageDraw, ImageFont
+
+try:
+    import numpy as np
+except ImportError:
+    print("Installing NumPy...")
+    import subprocess
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "numpy", "-q"])
+    import numpy as np
 
 
 def draw_rounded_rect(draw, coords, radius, fill, outline=None, width=1):
@@ -23,12 +48,22 @@ def draw_rounded_rect(draw, coords, radius, fill, outline=None, width=1):
     draw.rounded_rectangle(coords, radius=radius, fill=fill, outline=outline, width=width)
 
 
-def create_starship_icon(size=1024):
-    """Create a Starship Lander app icon"""
+# Tunable design constants (ship/flame in 1024px units, Earth as fractions of size)
+ICON_DEFAULTS = {
+    "earth_x": 0.82,
+    "earth_y": 0.15,
+    "earth_radius": 0.12,
+    "ship_y": 0.48,
+    "body_width": 100,
+    "body_height": 280,
+    "dome_height": 50,
+    "flame_width": 70,
+    "flame_height": 120,
+}
 
-    img = Image.new('RGB', (size, size), (0, 0, 0))
-    draw = ImageDraw.Draw(img)
 
+def draw_icon_background(draw, size, params=ICON_DEFAULTS):
+    """Icon layer: space gradient and stars"""
     # === BACKGROUND: Space gradient ===
     for y in range(size):
         ratio = y / size
@@ -47,10 +82,13 @@ def create_starship_icon(size=1024):
         draw.ellipse([x-star_size, y-star_size, x+star_size, y+star_size],
                      fill=(brightness, brightness, brightness))
 
+
+def draw_icon_earth(draw, size, params=ICON_DEFAULTS):
+    """Icon layer: Earth in the background"""
     # === EARTH in background (top right) ===
-    earth_radius = int(size * 0.12)
-    earth_x = int(size * 0.82)
-    earth_y = int(size * 0.15)
+    earth_radius = int(size * params["earth_radius"])
+    earth_x = int(size * params["earth_x"])
+    earth_y = int(size * params["earth_y"])
     # Earth base (blue)
     draw.ellipse([earth_x - earth_radius, earth_y - earth_radius,
                   earth_x + earth_radius, earth_y + earth_radius],
@@ -60,6 +98,9 @@ def create_starship_icon(size=1024):
                   earth_x + earth_radius//4, earth_y + earth_radius//3],
                  fill=(60, 140, 80))
 
+
+def draw_icon_platform(draw, size, params=ICON_DEFAULTS):
+    """Icon layer: landing platform"""
     # === LANDING PLATFORM ===
     platform_width = int(size * 0.35)
     platform_height = int(size * 0.025)
@@ -86,26 +127,17 @@ def create_starship_icon(size=1024):
                        sx + support_width//2, platform_y + platform_height + support_height],
                       fill=(50, 50, 55))
 
-    # === STARSHIP ===
+
+def draw_icon_flame(draw, size, params=ICON_DEFAULTS):
+    """Icon layer: engine flame below the ship"""
     ship_center_x = size // 2
-    ship_center_y = int(size * 0.48)
+    ship_center_y = int(size * params["ship_y"])
     scale = size / 1024
-
-    # Ship dimensions
-    body_width = int(100 * scale)
-    body_height = int(280 * scale)
-    dome_height = int(50 * scale)
-
-    # Ship colors
-    body_color = (225, 225, 230)  # Silver
-    body_highlight = (240, 240, 245)
-    body_shadow = (180, 180, 185)
-    flap_color = (55, 55, 60)  # Dark gray
-    engine_color = (40, 40, 45)
+    body_height = int(params["body_height"] * scale)
 
     # === FLAME (behind ship) ===
-    flame_width = int(70 * scale)
-    flame_height = int(120 * scale)
+    flame_width = int(params["flame_width"] * scale)
+    flame_height = int(params["flame_height"] * scale)
     flame_top_y = ship_center_y + body_height // 2 + int(10 * scale)
 
     # Outer flame (orange-red)
@@ -136,6 +168,26 @@ def create_starship_icon(size=1024):
     ]
     draw.polygon(core_flame_points, fill=(255, 255, 220))
 
+
+def draw_icon_ship(draw, size, params=ICON_DEFAULTS):
+    """Icon layer: Starship body, legs, flaps and engines"""
+    # === STARSHIP ===
+    ship_center_x = size // 2
+    ship_center_y = int(size * params["ship_y"])
+    scale = size / 1024
+
+    # Ship dimensions
+    body_width = int(params["body_width"] * scale)
+    body_height = int(params["body_height"] * scale)
+    dome_height = int(params["dome_height"] * scale)
+
+    # Ship colors
+    body_color = (225, 225, 230)  # Silver
+    body_highlight = (240, 240, 245)
+    body_shadow = (180, 180, 185)
+    flap_color = (55, 55, 60)  # Dark gray
+    engine_color = (40, 40, 45)
+
     # === LANDING LEGS ===
     leg_width = int(12 * scale)
     leg_length = int(80 * scale)
@@ -267,16 +319,373 @@ def create_starship_icon(size=1024):
     draw.rectangle([body_left, band_y, body_right, band_y + band_height],
                    fill=(30, 30, 35))
 
-    return img
 
+# Layers in paint order: (name, draw function, ICON_DEFAULTS keys it depends on).
+# Each is rendered onto its own transparent canvas.
+ICON_LAYERS = (
+    ("background", draw_icon_background, ()),
+    ("earth", draw_icon_earth, ("earth_x", "earth_y", "earth_radius")),
+    ("platform", draw_icon_platform, ()),
+    ("flame", draw_icon_flame, ("ship_y", "body_height", "flame_width", "flame_height")),
+    ("ship", draw_icon_ship, ("ship_y", "body_width", "body_height", "dome_height")),
+)
+
+LAYER_CACHE_LIMIT = 64
+
+
+def layer_key(name, deps, size, params):
+    """Cache key for a rendered layer: only the params it depends on matter"""
+    return (name, size) + tuple(params[key] for key in deps)
+
+
+def render_icon_layers(size, params=None, cache=None):
+    """Render every icon layer once.
+
+    Returns {name: (rgb, alpha)} as float32 arrays of shape (size, size, 3)
+    and (size, size, 1); alpha is the layer's coverage mask in 0..1.
+    params overrides ICON_DEFAULTS. With a cache dict, layers whose
+    dependencies are unchanged are reused instead of redrawn.
+    """
+    params = {**ICON_DEFAULTS, **(params or {})}
+    layers = {}
+    for name, draw_layer, deps in ICON_LAYERS:
+        key = layer_key(name, deps, size, params)
+        if cache is not None and key in cache:
+            layers[name] = cache[key]
+            continue
+        canvas = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+        draw_layer(ImageDraw.Draw(canvas), size, params)
+        rgba = np.asarray(canvas, dtype=np.float32)
+        layers[name] = (rgba[..., :3], rgba[..., 3:] / 255.0)
+        if cache is not None:
+            if len(cache) >= LAYER_CACHE_LIMIT:
+                cache.pop(next(iter(cache)))
+            cache[key] = layers[name]
+    return layers
+
+
+def composite_layers(layers, transforms=None):
+    """Recolor each layer with its color transform (if any) and alpha-composite in paint order"""
+    transforms = transforms or {}
+    out = None
+    for name, _, _ in ICON_LAYERS:
+        rgb, alpha = layers[name]
+        if name in transforms:
+            rgb = transforms[name](rgb)
+        out = rgb * alpha if out is None else rgb * alpha + out * (1.0 - alpha)
+    return Image.fromarray(np.clip(np.rint(out), 0, 255).astype(np.uint8), 'RGB')
+
+
+def create_starship_icon(size=1024):
+    """Create a Starship Lander app icon"""
+    return composite_layers(render_icon_layers(size))
+
+
+# === APPEARANCES (dark / tinted) ===
+
+# Rec. 709 luma weights
+LUMINANCE = np.array([0.2126, 0.7152, 0.0722], dtype=np.float32)
+
+
+def color_matrix(matrix, gain=1.0, bias=(0.0, 0.0, 0.0)):
+    """Layer transform: rgb -> gain * (matrix @ rgb) + bias, applied to every pixel at once"""
+    m = np.asarray(matrix, dtype=np.float32).T * gain
+    b = np.asarray(bias, dtype=np.float32)
+    return lambda rgb: rgb @ m + b
+
+
+def brightness(gain):
+    """Scale a layer's colors"""
+    return color_matrix(np.eye(3), gain)
 
-def main():
-    output_path = "../RocketLander/Assets.xcassets/AppIcon.appiconset/icon-1024.png"
 
-    print("Generating Starship Lander app icon...")
-    icon = create_starship_icon(1024)
-    icon.save(output_path, "PNG")
-    print(f"Icon saved to: {output_path}")
+def grayscale(gain=1.0):
+    """Replace a layer's colors with scaled luminance"""
+    return color_matrix(np.tile(LUMINANCE, (3, 1)), gain)
+
+
+# Per-layer transforms for each extra appearance; layers not listed are unchanged
+APPEARANCES = {
+    "dark": {
+        "background": brightness(0.35),  # near-black sky, dimmed stars
+        "earth": brightness(0.35),
+        "platform": brightness(0.75),
+        "ship": brightness(0.9),
+        # flame keeps full color: it's the accent that carries the icon on dark
+    },
+    "tinted": {
+        # Tinted icons are grayscale; iOS applies the user's tint color
+        "background": grayscale(0.3),
+        "earth": grayscale(0.3),
+        "platform": grayscale(0.8),
+        "flame": grayscale(1.3),
+        "ship": grayscale(1.0),
+    },
+}
+
+
+def create_icon_appearances(size, layers=None):
+    """Default, dark and tinted icons from one set of rendered layers"""
+    layers = layers or render_icon_layers(size)
+    icons = {"any": composite_layers(layers)}
+    for name, transforms in APPEARANCES.items():
+        icons[name] = composite_layers(layers, transforms)
+    return icons
+
+
+# === DESIGN SWEEP ===
+
+SWEEP_SIZE = 128
+LABEL_LINE_H = 12
+
+# Per-process layer cache for sweep workers (seeded with the shared layers)
+_sweep_cache = {}
+
+
+def parse_sweep_axis(text):
+    """'flame_height=80:160:5' (start:stop:count) or 'body_width=80,100,120' -> (name, values)"""
+    name, _, spec = text.partition("=")
+    if name not in ICON_DEFAULTS:
+        raise argparse.ArgumentTypeError(f"unknown parameter '{name}' (choose from {', '.join(ICON_DEFAULTS)})")
+    try:
+        if ":" in spec:
+            start, stop, count = spec.split(":")
+            if int(count) < 1:
+                raise argparse.ArgumentTypeError(f"bad range '{spec}': count must be at least 1")
+            values = [round(v, 4) for v in np.linspace(float(start), float(stop), int(count)).tolist()]
+        else:
+            values = [float(v) for v in spec.split(",") if v.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"bad range '{spec}' (use start:stop:count or v1,v2,...)")
+    if not values:
+        raise argparse.ArgumentTypeError(f"no values for '{name}' (use start:stop:count or v1,v2,...)")
+    return name, values
+
+
+def _init_sweep_worker(shared_layers):
+    """Seed a worker's layer cache with the layers every variant shares"""
+    _sweep_cache.update(shared_layers)
+
+
+def _render_sweep_variant(job):
+    """Worker: composite one variant, reusing cached layers where its params allow"""
+    size, params = job
+    return composite_layers(render_icon_layers(size, params, _sweep_cache)).tobytes()
+
+
+def render_sweep(axes, size=SWEEP_SIZE, workers=None):
+    """Render every combination of the sweep axes across a process pool.
+
+    axes is [(param, values), ...]. Returns [(params, Image), ...] in
+    itertools.product order (last axis varies fastest).
+    """
+    names = [name for name, _ in axes]
+    combos = [dict(zip(names, values)) for values in itertools.product(*(values for _, values in axes))]
+
+    # Layers no swept param touches are identical in every variant: render them once here
+    defaults_cache = {}
+    render_icon_layers(size, None, defaults_cache)
+    shared = {}
+    for name, _, deps in ICON_LAYERS:
+        if not set(deps) & set(names):
+            key = layer_key(name, deps, size, ICON_DEFAULTS)
+            shared[key] = defaults_cache[key]
+
+    workers = workers or os.cpu_count() or 1
+    # Contiguous chunks keep neighbouring variants (which share slow-axis layers) on one worker
+    chunksize = max(1, len(combos) // (workers * 4))
+    jobs = [(size, combo) for combo in combos]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_sweep_worker,
+                             initargs=(shared,)) as pool:
+        raw = list(pool.map(_render_sweep_variant, jobs, chunksize=chunksize))
+    return [(combo, Image.frombytes('RGB', (size, size), data)) for combo, data in zip(combos, raw)]
+
+
+def build_contact_sheet(results, columns=None):
+    """Tile sweep results into a grid with each variant's swept values printed under it"""
+    size = results[0][1].width
+    n_labels = len(results[0][0])
+    cell_h = size + LABEL_LINE_H * n_labels + 6
+    columns = columns or math.ceil(math.sqrt(len(results)))
+    rows = math.ceil(len(results) / columns)
+
+    sheet = Image.new('RGB', (columns * size, rows * cell_h), (15, 15, 20))
+    draw = ImageDraw.Draw(sheet)
+    font = ImageFont.load_default()
+    for i, (params, icon) in enumerate(results):
+        x = (i % columns) * size
+        y = (i // columns) * cell_h
+        sheet.paste(icon, (x, y))
+        for line, (name, value) in enumerate(params.items()):
+            draw.text((x + 4, y + size + 3 + line * LABEL_LINE_H), f"{name}={value:g}",
+                      fill=(200, 200, 200), font=font)
+    return sheet
+
+
+# === APPICON SET ===
+
+APPICONSET_DIR = "../RocketLander/Assets.xcassets/AppIcon.appiconset"
+HASH_FILE = ".cache/icon_master.sha256"
+
+MASTER_SIZE = 1024
+SUPERSAMPLE = 2
+
+# (idiom, size in points, scale) for every slot in the icon set; the universal
+# 1024pt slot is the App Store icon and the base entry for the dark/tinted variants
+ICON_SLOTS = [
+    ("iphone", 20, 2), ("iphone", 20, 3),
+    ("iphone", 29, 2), ("iphone", 29, 3),
+    ("iphone", 40, 2), ("iphone", 40, 3),
+    ("iphone", 60, 2), ("iphone", 60, 3),
+    ("ipad", 20, 1), ("ipad", 20, 2),
+    ("ipad", 29, 1), ("ipad", 29, 2),
+    ("ipad", 40, 1), ("ipad", 40, 2),
+    ("ipad", 76, 1), ("ipad", 76, 2),
+    ("ipad", 83.5, 2),
+    ("universal", 1024, 1),
+]
+
+
+def slot_pixels(size_pt, scale):
+    """Pixel edge length of an icon slot"""
+    return int(round(size_pt * scale))
+
+
+def icon_filename(pixels, appearance="any"):
+    """One PNG per pixel size; slots that share a size share the file"""
+    if appearance == "any":
+        return f"icon-{pixels}.png"
+    return f"icon-{pixels}-{appearance}.png"
+
+
+def format_points(size_pt):
+    """Asset catalog size string: 20 -> '20x20', 83.5 -> '83.5x83.5'"""
+    text = f"{size_pt:g}"
+    return f"{text}x{text}"
+
+
+def build_contents_json():
+    """Contents.json for the icon set, in Xcode's key order and spacing"""
+    images = []
+    for idiom, size_pt, scale in ICON_SLOTS:
+        entry = {"filename": icon_filename(slot_pixels(size_pt, scale)), "idiom": idiom}
+        if idiom == "universal":
+            entry["platform"] = "ios"
+        else:
+            entry["scale"] = f"{scale}x"
+        entry["size"] = format_points(size_pt)
+        images.append(entry)
+    # iOS 18 dark/tinted icons are luminosity variants of the universal 1024pt entry
+    for appearance in APPEARANCES:
+        images.append({
+            "appearances": [{"appearance": "luminosity", "value": appearance}],
+            "filename": icon_filename(MASTER_SIZE, appearance),
+            "idiom": "universal",
+            "platform": "ios",
+            "size": format_points(MASTER_SIZE),
+        })
+    contents = {"images": images, "info": {"author": "xcode", "version": 1}}
+    return json.dumps(contents, indent=2, separators=(",", " : ")) + "\n"
+
+
+def master_hash(masters):
+    """Hash of every master's pixels plus the slot table, so any change triggers output"""
+    digest = hashlib.sha256()
+    for appearance, master in sorted(masters.items()):
+        digest.update(f"{appearance}{master.mode}{master.size}".encode())
+        digest.update(master.tobytes())
+    digest.update(repr(ICON_SLOTS).encode())
+    return digest.hexdigest()
+
+
+def downsample(master, pixels):
+    """High-quality reduction of the master to one icon size"""
+    if master.width == pixels:
+        return master
+    return master.resize((pixels, pixels), Image.LANCZOS, reducing_gap=3.0)
+
+
+def icon_outputs():
+    """(appearance, pixels) for every PNG in the set"""
+    sizes = sorted({slot_pixels(size_pt, scale) for _, size_pt, scale in ICON_SLOTS}, reverse=True)
+    return [("any", pixels) for pixels in sizes] + [(name, MASTER_SIZE) for name in APPEARANCES]
+
+
+def write_icon_set(masters, output_dir, workers=4):
+    """Downsample the masters into every output in parallel and write the set"""
+    os.makedirs(output_dir, exist_ok=True)
+
+    def render(output):
+        appearance, pixels = output
+        path = os.path.join(output_dir, icon_filename(pixels, appearance))
+        downsample(masters[appearance], pixels).save(path, "PNG")
+        return path
+
+    # Pillow releases the GIL while resampling and encoding, so threads scale here
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        paths = list(pool.map(render, icon_outputs()))
+
+    with open(os.path.join(output_dir, "Contents.json"), "w", encoding="utf-8") as f:
+        f.write(build_contents_json())
+    return paths
+
+
+def icon_set_complete(output_dir):
+    """True if every file the icon set references is on disk"""
+    names = {icon_filename(pixels, appearance) for appearance, pixels in icon_outputs()}
+    names.add("Contents.json")
+    return all(os.path.exists(os.path.join(output_dir, name)) for name in names)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the Starship Lander AppIcon set")
+    parser.add_argument("--force", action="store_true", help="Rewrite even if the master is unchanged")
+    parser.add_argument("--output", type=str, default=APPICONSET_DIR, metavar="DIR",
+                        help="AppIcon.appiconset directory")
+    parser.add_argument("--workers", type=int, default=4, metavar="N", help="Downsampling threads (default 4)")
+    parser.add_argument("--sweep", type=parse_sweep_axis, nargs="+", metavar="PARAM=RANGE",
+                        help="Design sweep instead of the icon set, e.g. flame_height=80:160:5 body_width=80,100")
+    parser.add_argument("--sweep-size", type=int, default=SWEEP_SIZE, metavar="PX",
+                        help=f"Variant thumbnail size (default {SWEEP_SIZE})")
+    parser.add_argument("--sweep-workers", type=int, metavar="N", help="Sweep processes (default: CPU count)")
+    parser.add_argument("--columns", type=int, metavar="N", help="Contact sheet columns (default: square grid)")
+    parser.add_argument("--sheet", type=str, default="icon_sweep.png", metavar="PATH",
+                        help="Contact sheet output (default icon_sweep.png)")
+    args = parser.parse_args()
+
+    if args.sweep:
+        names = [name for name, _ in args.sweep]
+        repeated = sorted({name for name in names if names.count(name) > 1})
+        if repeated:
+            parser.error(f"--sweep: each parameter may appear once (repeated: {', '.join(repeated)})")
+        total = math.prod(len(values) for _, values in args.sweep)
+        print(f"Sweeping {total} icon variant(s) at {args.sweep_size}px...")
+        start = time.perf_counter()
+        results = render_sweep(args.sweep, args.sweep_size, args.sweep_workers)
+        build_contact_sheet(results, args.columns).save(args.sheet, "PNG")
+        print(f"Contact sheet saved to: {args.sheet} ({time.perf_counter() - start:.2f}s)")
+        return
+
+    print(f"Rendering {MASTER_SIZE * SUPERSAMPLE}px master icon layers...")
+    masters = create_icon_appearances(MASTER_SIZE * SUPERSAMPLE)
+    digest = master_hash(masters)
+
+    hash_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), HASH_FILE)
+    previous = None
+    if os.path.exists(hash_path):
+        with open(hash_path, "r", encoding="utf-8") as f:
+            previous = f.read().strip()
+
+    if digest == previous and icon_set_complete(args.output) and not args.force:
+        print(f"Master unchanged ({digest[:12]}), icon set is up to date.")
+        return
+
+    paths = write_icon_set(masters, args.output, args.workers)
+    os.makedirs(os.path.dirname(hash_path), exist_ok=True)
+    with open(hash_path, "w", encoding="utf-8") as f:
+        f.write(digest + "\n")
+
+    print(f"Wrote {len(paths)} icons ({', '.join(['any'] + list(APPEARANCES))}) + Contents.json to: {args.output}")
     print("Done!")
 
 
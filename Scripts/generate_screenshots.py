@@ -2,11 +2,27 @@
 """
 App Store Screenshot Generator for Starship Lander
 Generates 3 screenshots at 1260x2736 pixels (iPhone 6.5")
+
+Usage:
+    python3 generate_screenshots.py                           # Plain screenshots
+    python3 generate_screenshots.py --effect heatShimmer      # Mercury shimmer on gameplay
+    python3 generate_screenshots.py --effect denseAtmosphere  # Titan haze on gameplay
+    python3 generate_screenshots.py --effect heatShimmer --frames 12  # Animated GIF
+    python3 generate_screenshots.py --supersample 4 --max-bands 2     # Anti-aliased, bounded memory
+    python3 generate_screenshots.py --variants variants.json          # Gameplay A/B variants
 """
 
 import sys
 import math
 import random
+import time
+import argparse
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import difflib
+import inspect
+import json
 
 try:
     from PIL import Image, ImageDraw, ImageFont
@@ -16,6 +32,14 @@ except ImportError:
     subprocess.check_call([sys.executable, "-m", "pip", "install", "Pillow", "-q"])
     from PIL import Image, ImageDraw, ImageFont
 
+try:
+    import numpy as np
+except ImportError:
+    print("Installing NumPy...")
+    import subprocess
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "numpy", "-q"])
+    import numpy as np
+
 # Screenshot dimensions (iPhone 6.5")
 WIDTH = 1260
 HEIGHT = 2736
@@ -32,6 +56,9 @@ DARK_GRAY = (40, 40, 45)
 SILVER = (225, 225, 230)
 LIGHT_GRAY = (200, 200, 200)
 
+# Titan denseAtmosphere haze color (skyColorBottom from LevelDefinition.swift)
+TITAN_HAZE = (128, 102, 51)
+
 
 def draw_space_background(draw, width, height):
     """Draw space gradient background with stars"""
@@ -242,11 +269,257 @@ def draw_button(draw, x, y, w, h, text, color, text_color=WHITE):
     draw.text((x + w//2 - len(text)*4, y + h//2 - 8), text, fill=text_color, font=None)
 
 
-def create_screenshot_1_menu():
-    """Screenshot 1: Menu Screen"""
-    img = Image.new('RGB', (WIDTH, HEIGHT), BLACK)
-    draw = ImageDraw.Draw(img)
+# === POST-PROCESSING (campaign atmosphere effects) ===
+
+def clamp_roi(roi, width, height):
+    """Clamp an (x0, y0, x1, y1) region to the frame; None means the full frame"""
+    if roi is None:
+        return 0, 0, width, height
+    x0, y0, x1, y1 = roi
+    x0, x1 = max(0, min(x0, width)), max(0, min(x1, width))
+    y0, y1 = max(0, min(y0, height)), max(0, min(y1, height))
+    return x0, y0, max(x0, x1), max(y0, y1)
+
+
+@lru_cache(maxsize=8)
+def make_shimmer_map(width, height, wavelength=36.0, seed=7):
+    """Build the static part of a heat-shimmer displacement field for a region.
+
+    Returns (row_phase, col_phase, weight) arrays that broadcast to (height, width).
+    Cached so every frame of an animation reuses the same map.
+    """
+    rng = np.random.default_rng(seed)
+    row_phase = (2 * math.pi / wavelength) * np.arange(height, dtype=np.float32)[:, None]
+
+    # Smooth random per-column phase so the ripples aren't perfectly horizontal
+    knots = rng.uniform(0, 2 * math.pi, size=width // 64 + 2).astype(np.float32)
+    col_phase = np.interp(np.arange(width, dtype=np.float32) / 64, np.arange(len(knots)), knots)
+    col_phase = col_phase.astype(np.float32)[None, :]
+
+    # Heat rises off the surface: strongest at the bottom of the region
+    weight = np.linspace(0.15, 1.0, height, dtype=np.float32)[:, None] ** 2
+    return row_phase, col_phase, weight
+
+
+def warp_region(arr, roi, dx, dy):
+    """Resample a region of an HxWxC array at (x + dx, y + dy) via gather indexing"""
+    height, width = arr.shape[:2]
+    x0, y0, x1, y1 = roi
+    ys = np.arange(y0, y1, dtype=np.float32)[:, None]
+    xs = np.arange(x0, x1, dtype=np.float32)[None, :]
+    src_x = np.clip(np.rint(xs + dx), 0, width - 1).astype(np.intp)
+    src_y = np.clip(np.rint(ys + dy), 0, height - 1).astype(np.intp)
+
+    out = arr.copy()
+    out[y0:y1, x0:x1] = arr[src_y, src_x]
+    return out
+
+
+def apply_heat_shimmer(img, roi=None, amplitude=4.0, wavelength=36.0, phase=0.0, seed=7):
+    """Mercury heatShimmer: ripple pixels sideways, strongest near the ground.
+
+    phase is in cycles; step it per frame for animation (0.0 for stills).
+    """
+    arr = np.asarray(img)
+    x0, y0, x1, y1 = roi = clamp_roi(roi, img.width, img.height)
+    if x1 <= x0 or y1 <= y0:
+        return img.copy()
+
+    row_phase, col_phase, weight = make_shimmer_map(x1 - x0, y1 - y0, wavelength, seed)
+    t = 2 * math.pi * phase
+    dx = amplitude * weight * np.sin(row_phase + col_phase + t)
+    dy = 0.3 * amplitude * weight * np.sin(0.5 * row_phase - col_phase + 1.7 * t)
+    return Image.fromarray(warp_region(arr, roi, dx, dy), img.mode)
+
+
+def apply_atmospheric_haze(img, roi=None, color=TITAN_HAZE, density=0.55, falloff=1.6):
+    """Titan denseAtmosphere: blend toward the haze color, thicker with depth (lower in frame)"""
+    arr = np.asarray(img)
+    x0, y0, x1, y1 = clamp_roi(roi, img.width, img.height)
+    if x1 <= x0 or y1 <= y0:
+        return img.copy()
+
+    depth = np.linspace(0.0, 1.0, y1 - y0, dtype=np.float32)[:, None, None]
+    alpha = density * depth ** falloff
+    channels = arr.shape[2]
+    haze = np.array(color[:channels] + (255,) * (channels - len(color)), dtype=np.float32)
+
+    out = arr.copy()
+    region = out[y0:y1, x0:x1].astype(np.float32)
+    out[y0:y1, x0:x1] = np.rint(region + (haze - region) * alpha).astype(np.uint8)
+    return Image.fromarray(out, img.mode)
+
+
+LEVEL_POST_EFFECTS = ("heatShimmer", "denseAtmosphere")
+
+
+def apply_level_effect(img, mechanic, roi=None, phase=0.0):
+    """Apply a campaign SpecialMechanic post-effect to a rendered frame"""
+    if mechanic == "heatShimmer":
+        return apply_heat_shimmer(img, roi, phase=phase)
+    if mechanic == "denseAtmosphere":
+        # Haze has no motion; drift the density slightly so animated frames breathe
+        return apply_atmospheric_haze(img, roi, density=0.55 + 0.05 * math.sin(2 * math.pi * phase))
+    raise ValueError(f"Unknown effect '{mechanic}'. Choose from: {', '.join(LEVEL_POST_EFFECTS)}")
+
+
+def default_effect_roi(mechanic, width, height):
+    """Region each effect needs: shimmer only near the surface, haze over the whole sky"""
+    if mechanic == "heatShimmer":
+        return 0, int(height * 0.55), width, height
+    return None
+
+
+def render_effect_frames(img, mechanic, n_frames, roi=None):
+    """Yield n_frames looping frames of an effect applied to one rendered still"""
+    for i in range(n_frames):
+        yield apply_level_effect(img, mechanic, roi, phase=i / n_frames)
+
+
+# === BANDED RENDERING (large / supersampled canvases) ===
+
+# One recorded draw call: ImageDraw method name, points in scene coordinates,
+# extra positional args (text), keyword args, and (x0, y0, x1, y1) bounds
+DrawOp = namedtuple("DrawOp", "method points args kwargs bbox")
 
+# Keyword args measured in pixels that must follow the render scale
+SCALED_KWARGS = ("width", "radius")
+
+# Rough extent of the default bitmap font, used only for culling text ops
+TEXT_CHAR_W = 8
+TEXT_LINE_H = 16
+
+
+def flatten_points(xy):
+    """Normalize ImageDraw coordinates (flat list or list of pairs) to [(x, y), ...]"""
+    if xy and isinstance(xy[0], (tuple, list)):
+        return [(p[0], p[1]) for p in xy]
+    return list(zip(xy[0::2], xy[1::2]))
+
+
+class SceneRecorder:
+    """Stands in for ImageDraw while a scene function runs and captures a display list.
+
+    Recording runs the scene once, single-threaded, so the module-level random
+    calls inside the draw helpers stay deterministic; bands then replay the list.
+    """
+
+    def __init__(self):
+        self.ops = []
+
+    def _record(self, method, xy, args=(), **kwargs):
+        points = flatten_points(xy)
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        if method == "text":
+            bbox = (xs[0], ys[0], xs[0] + TEXT_CHAR_W * len(args[0]), ys[0] + TEXT_LINE_H)
+        else:
+            pad = (kwargs.get("width") or 1) / 2 + 1
+            bbox = (min(xs) - pad, min(ys) - pad, max(xs) + pad, max(ys) + pad)
+        self.ops.append(DrawOp(method, points, args, kwargs, bbox))
+
+    def line(self, xy, **kwargs):
+        self._record("line", xy, **kwargs)
+
+    def rectangle(self, xy, **kwargs):
+        self._record("rectangle", xy, **kwargs)
+
+    def rounded_rectangle(self, xy, **kwargs):
+        self._record("rounded_rectangle", xy, **kwargs)
+
+    def ellipse(self, xy, **kwargs):
+        self._record("ellipse", xy, **kwargs)
+
+    def polygon(self, xy, **kwargs):
+        self._record("polygon", xy, **kwargs)
+
+    def text(self, xy, text, **kwargs):
+        self._record("text", [xy], (text,), **kwargs)
+
+
+def record_scene(draw_scene):
+    """Run a draw_screenshot_* function against a recorder and return its display list"""
+    recorder = SceneRecorder()
+    draw_scene(recorder)
+    return recorder.ops
+
+
+@lru_cache(maxsize=4)
+def scaled_default_font(scale):
+    """Default font, loaded once per scale and enlarged for supersampled rendering"""
+    if scale == 1:
+        return ImageFont.load_default()
+    return ImageFont.load_default(size=11 * scale)
+
+
+def replay_ops(draw, ops, box, scale=1):
+    """Replay the ops that intersect scene box (x0, y0, x1, y1) onto a box-sized canvas"""
+    x0, y0, x1, y1 = box
+    for op in ops:
+        if op.bbox[3] < y0 or op.bbox[1] >= y1 or op.bbox[2] < x0 or op.bbox[0] >= x1:
+            continue
+        points = [((x - x0) * scale, (y - y0) * scale) for x, y in op.points]
+        kwargs = dict(op.kwargs)
+        if scale != 1:
+            # Lines and outlines default to 1px; make that explicit so it scales too
+            if op.method == "line" or "outline" in kwargs:
+                kwargs.setdefault("width", 1)
+            for key in SCALED_KWARGS:
+                if key in kwargs:
+                    kwargs[key] = max(1, int(kwargs[key] * scale))
+        if op.method == "text":
+            if kwargs.get("font") is None:
+                kwargs["font"] = scaled_default_font(scale)
+            draw.text(points[0], *op.args, **kwargs)
+        else:
+            getattr(draw, op.method)(points, **kwargs)
+
+
+def render_band(ops, y0, y1, scale, supersample, margin):
+    """Rasterize one horizontal band and return it at output resolution (margins trimmed)"""
+    top = max(0, y0 - margin)
+    bottom = min(HEIGHT, y1 + margin)
+    render_scale = scale * supersample
+
+    band = Image.new('RGB', (WIDTH * render_scale, (bottom - top) * render_scale), BLACK)
+    replay_ops(ImageDraw.Draw(band), ops, (0, top, WIDTH, bottom), render_scale)
+    if supersample > 1:
+        band = band.resize((WIDTH * scale, (bottom - top) * scale), Image.LANCZOS)
+    return band.crop((0, (y0 - top) * scale, WIDTH * scale, (y1 - top) * scale))
+
+
+def render_banded(draw_scene, scale=1, supersample=1, band_height=256, max_bands=4, workers=4):
+    """Render a scene as horizontal bands on a thread pool and stitch them.
+
+    Output is (WIDTH * scale, HEIGHT * scale). Each band is drawn at
+    scale * supersample and downsampled before stitching, so at most
+    max_bands supersampled bands are alive at once on top of the output canvas.
+    """
+    return stitch_bands(record_scene(draw_scene), scale, supersample, band_height, max_bands, workers)
+
+
+def stitch_bands(ops, scale=1, supersample=1, band_height=256, max_bands=4, workers=4):
+    """Rasterize a recorded display list band by band (see render_banded)"""
+    # Overlap bands slightly so the resampling filter has context across seams
+    margin = 4 if supersample > 1 else 0
+    bands = [(y, min(y + band_height, HEIGHT)) for y in range(0, HEIGHT, band_height)]
+
+    img = Image.new('RGB', (WIDTH * scale, HEIGHT * scale), BLACK)
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, max_bands))) as pool:
+        for y0, y1 in bands:
+            if len(pending) >= max_bands:
+                done_y0, future = pending.popleft()
+                img.paste(future.result(), (0, done_y0 * scale))
+            pending.append((y0, pool.submit(render_band, ops, y0, y1, scale, supersample, margin)))
+        while pending:
+            done_y0, future = pending.popleft()
+            img.paste(future.result(), (0, done_y0 * scale))
+    return img
+
+
+def draw_screenshot_1_menu(draw):
+    """Screenshot 1: Menu Screen"""
     draw_space_background(draw, WIDTH, HEIGHT)
 
     # Title
@@ -308,14 +581,19 @@ def create_screenshot_1_menu():
     # Version number
     draw.text((WIDTH//2 - 30, 2650), "v1.1.5", fill=(100, 100, 100), font=None)
 
-    return img
 
 
-def create_screenshot_2_gameplay():
-    """Screenshot 2: In-Game"""
-    img = Image.new('RGB', (WIDTH, HEIGHT), BLACK)
-    draw = ImageDraw.Draw(img)
+def hud_status(value, safe):
+    """HUD color, badge fill and badge text for a velocity against its safe limit"""
+    if value >= safe:
+        return RED, (200, 0, 0, 50), "!!"
+    if value >= safe * 0.8:
+        return YELLOW, (200, 200, 0, 50), "OK"
+    return GREEN, (0, 200, 0, 50), "OK"
 
+
+def draw_gameplay_backdrop(draw):
+    """Screenshot 2 static layer: sky, moon, terrain, platform, ship"""
     draw_space_background(draw, WIDTH, HEIGHT)
 
     # Moon in background
@@ -335,10 +613,15 @@ def create_screenshot_2_gameplay():
     draw.ellipse([50, 120, 130, 200], fill=(100, 100, 100, 150))
     draw.text((75, 145), "X", fill=WHITE, font=None)
 
+
+def draw_gameplay_hud(draw, fuel_pct=87, vert_vel=45, horiz_vel=12):
+    """Screenshot 2 HUD layer: fuel gauge and velocity readouts"""
     # Fuel gauge (top right)
-    draw.text((WIDTH - 200, 130), "87%", fill=GREEN, font=None)
+    fuel_color = GREEN if fuel_pct > 50 else (YELLOW if fuel_pct > 20 else RED)
+    draw.text((WIDTH - 200, 130), f"{int(fuel_pct)}%", fill=fuel_color, font=None)
     draw.rectangle([WIDTH - 200, 170, WIDTH - 80, 185], fill=(60, 60, 60))
-    draw.rectangle([WIDTH - 200, 170, WIDTH - 95, 185], fill=GREEN)
+    if fuel_pct > 0:
+        draw.rectangle([WIDTH - 200, 170, WIDTH - 200 + math.ceil(120 * fuel_pct / 100), 185], fill=fuel_color)
 
     # Velocity HUD (center top area)
     hud_x = WIDTH//2 - 100
@@ -351,20 +634,22 @@ def create_screenshot_2_gameplay():
 
     # VERT section
     draw.text((hud_x + 60, hud_y + 20), "VERT", fill=GRAY, font=None)
-    draw.text((hud_x + 60, hud_y + 50), "45", fill=YELLOW, font=None)
+    vert_color, vert_badge, vert_text = hud_status(vert_vel, 50)
+    draw.text((hud_x + 60, hud_y + 50), str(int(vert_vel)), fill=vert_color, font=None)
     draw.rounded_rectangle([hud_x + 130, hud_y + 45, hud_x + 180, hud_y + 75],
-                          radius=5, fill=(200, 200, 0, 50))
-    draw.text((hud_x + 140, hud_y + 50), "OK", fill=YELLOW, font=None)
+                          radius=5, fill=vert_badge)
+    draw.text((hud_x + 140, hud_y + 50), vert_text, fill=vert_color, font=None)
 
     # Divider
     draw.line([(hud_x + 20, hud_y + 100), (hud_x + hud_w - 20, hud_y + 100)], fill=(80, 80, 80), width=1)
 
     # HORIZ section
     draw.text((hud_x + 60, hud_y + 120), "HORIZ", fill=GRAY, font=None)
-    draw.text((hud_x + 60, hud_y + 150), "12", fill=GREEN, font=None)
+    horiz_color, horiz_badge, horiz_text = hud_status(horiz_vel, 30)
+    draw.text((hud_x + 60, hud_y + 150), str(int(horiz_vel)), fill=horiz_color, font=None)
     draw.rounded_rectangle([hud_x + 130, hud_y + 145, hud_x + 180, hud_y + 175],
-                          radius=5, fill=(0, 200, 0, 50))
-    draw.text((hud_x + 140, hud_y + 150), "OK", fill=GREEN, font=None)
+                          radius=5, fill=horiz_badge)
+    draw.text((hud_x + 140, hud_y + 150), horiz_text, fill=horiz_color, font=None)
 
     # Divider
     draw.line([(hud_x + 20, hud_y + 200), (hud_x + hud_w - 20, hud_y + 200)], fill=(80, 80, 80), width=1)
@@ -373,6 +658,9 @@ def create_screenshot_2_gameplay():
     draw.text((hud_x + 30, hud_y + 220), "SAFE:", fill=GRAY, font=None)
     draw.text((hud_x + 90, hud_y + 220), "V<50  H<30", fill=(100, 200, 100), font=None)
 
+
+def draw_gameplay_controls(draw, thrust_label="THRUST"):
+    """Screenshot 2 controls layer"""
     # Control buttons at bottom
     # Thrust button (center, large)
     thrust_x = WIDTH//2 - 150
@@ -386,16 +674,34 @@ def create_screenshot_2_gameplay():
         draw.line([(thrust_x, thrust_y + i), (thrust_x + thrust_w, thrust_y + i)], fill=(r, g, 0))
     draw.rounded_rectangle([thrust_x, thrust_y, thrust_x + thrust_w, thrust_y + thrust_h],
                           radius=20, outline=(255, 255, 255, 100), width=3)
-    draw.text((thrust_x + 100, thrust_y + 35), "THRUST", fill=WHITE, font=None)
+    # Default font is ~8px per glyph; "THRUST" lands at thrust_x + 100
+    draw.text((thrust_x + thrust_w // 2 - len(thrust_label) * 25 // 3, thrust_y + 35),
+              thrust_label, fill=WHITE, font=None)
 
-    return img
 
+# Layers are drawn in order; A/B variants override keyword args of individual layers
+GAMEPLAY_LAYERS = (draw_gameplay_backdrop, draw_gameplay_hud, draw_gameplay_controls)
 
-def create_screenshot_3_gameover():
-    """Screenshot 3: Game Over / Crash"""
-    img = Image.new('RGB', (WIDTH, HEIGHT), BLACK)
-    draw = ImageDraw.Draw(img)
 
+def layer_params(layer):
+    """Overridable keyword args of a scene layer"""
+    return [name for name in inspect.signature(layer).parameters if name != "draw"]
+
+
+def draw_layers(draw, layers, **overrides):
+    """Draw scene layers in order, routing each override to the layer that takes it"""
+    for layer in layers:
+        layer(draw, **{k: v for k, v in overrides.items() if k in layer_params(layer)})
+
+
+def draw_screenshot_2_gameplay(draw, **overrides):
+    """Screenshot 2: In-Game (HUD values are overridable for A/B variants)"""
+    draw_layers(draw, GAMEPLAY_LAYERS, **overrides)
+
+
+
+def draw_screenshot_3_gameover(draw):
+    """Screenshot 3: Game Over / Crash"""
     draw_space_background(draw, WIDTH, HEIGHT)
 
     # Moon
@@ -470,31 +776,188 @@ def create_screenshot_3_gameover():
     draw.rectangle([WIDTH - 200, 170, WIDTH - 80, 185], fill=(60, 60, 60))
     draw.rectangle([WIDTH - 200, 170, WIDTH - 172, 185], fill=RED)
 
-    return img
+
+
+# === A/B VARIANTS (dirty-region re-rendering) ===
+
+def op_key(op):
+    """Hashable identity of a draw op, for diffing display lists"""
+    return op.method, tuple(op.points), op.args, tuple(sorted(op.kwargs.items()))
+
+
+def op_box(op, pad=2):
+    """Integer scene box around an op, clamped to the canvas (None if off-canvas)"""
+    bx0, by0, bx1, by1 = op.bbox
+    box = (max(0, math.floor(bx0) - pad), max(0, math.floor(by0) - pad),
+           min(WIDTH, math.ceil(bx1) + pad + 1), min(HEIGHT, math.ceil(by1) + pad + 1))
+    return box if box[2] > box[0] and box[3] > box[1] else None
+
+
+def merge_boxes(boxes):
+    """Union overlapping boxes so shared pixels are only re-rendered once"""
+    merged = []
+    for box in boxes:
+        while True:
+            for i, other in enumerate(merged):
+                if box[0] < other[2] and other[0] < box[2] and box[1] < other[3] and other[1] < box[3]:
+                    box = (min(box[0], other[0]), min(box[1], other[1]),
+                           max(box[2], other[2]), max(box[3], other[3]))
+                    del merged[i]
+                    break
+            else:
+                break
+        merged.append(box)
+    return merged
+
+
+def dirty_boxes(base_ops, variant_ops):
+    """Scene boxes covering every op that differs between two display lists"""
+    if len(base_ops) == len(variant_ops):
+        # Common case: same structure, only values changed
+        changed = [(a, b) for a, b in zip(base_ops, variant_ops) if a != b]
+        candidates = [op for pair in changed for op in pair]
+    else:
+        matcher = difflib.SequenceMatcher(None, [op_key(op) for op in base_ops],
+                                          [op_key(op) for op in variant_ops], autojunk=False)
+        candidates = []
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag != "equal":
+                # Old pixels must be painted over and new ones drawn: cover both
+                candidates += base_ops[i1:i2] + variant_ops[j1:j2]
+    return merge_boxes([box for box in map(op_box, candidates) if box])
+
+
+def render_region(ops, box, scale=1):
+    """Rasterize only a scene box (at output scale) by replaying the ops that touch it"""
+    x0, y0, x1, y1 = box
+    region = Image.new('RGB', ((x1 - x0) * scale, (y1 - y0) * scale), BLACK)
+    replay_ops(ImageDraw.Draw(region), ops, box, scale)
+    return region
+
+
+def render_variants(layers, variants, scale=1, band_height=256, max_bands=4, workers=4):
+    """Render a layered scene once, then each variant by re-rasterizing only its dirty boxes.
+
+    variants maps a name to keyword overrides for the layers. Only layers whose
+    arguments are overridden are re-recorded and diffed. Yields
+    (name, image, dirty_boxes) in input order. The yielded image is one shared
+    canvas restored after each variant, so save or copy it before advancing.
+    Supersampling isn't supported: boxes are re-drawn at output scale and
+    must match the base pixels exactly.
+    """
+    params = {layer: layer_params(layer) for layer in layers}
+    base_layer_ops = [record_scene(layer) for layer in layers]
+    base_img = stitch_bands([op for ops in base_layer_ops for op in ops], scale=scale,
+                            band_height=band_height, max_bands=max_bands, workers=workers)
+    img = base_img.copy()
+
+    for name, overrides in variants.items():
+        unknown = set(overrides) - {p for names in params.values() for p in names}
+        if unknown:
+            raise ValueError(f"Variant '{name}': unknown override(s) {', '.join(sorted(unknown))}")
+
+        ops, boxes = [], []
+        for layer, layer_ops in zip(layers, base_layer_ops):
+            layer_overrides = {k: v for k, v in overrides.items() if k in params[layer]}
+            if layer_overrides:
+                variant_ops = record_scene(lambda draw: layer(draw, **layer_overrides))
+                boxes += dirty_boxes(layer_ops, variant_ops)
+                layer_ops = variant_ops
+            ops += layer_ops
+        boxes = merge_boxes(boxes)
+
+        scaled = [tuple(v * scale for v in box) for box in boxes]
+        for box, out_box in zip(boxes, scaled):
+            img.paste(render_region(ops, box, scale), out_box[:2])
+        yield name, img, boxes
+        for out_box in scaled:
+            img.paste(base_img.crop(out_box), out_box[:2])
+
+
+def create_screenshot_1_menu(**render_opts):
+    """Screenshot 1 rendered through the banded renderer"""
+    return render_banded(draw_screenshot_1_menu, **render_opts)
+
+
+def create_screenshot_2_gameplay(**render_opts):
+    """Screenshot 2 rendered through the banded renderer"""
+    return render_banded(draw_screenshot_2_gameplay, **render_opts)
+
+
+def create_screenshot_3_gameover(**render_opts):
+    """Screenshot 3 rendered through the banded renderer"""
+    return render_banded(draw_screenshot_3_gameover, **render_opts)
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate App Store screenshots")
+    parser.add_argument("--effect", choices=sorted(LEVEL_POST_EFFECTS),
+                        help="Apply a campaign post-effect to the gameplay screenshot")
+    parser.add_argument("--frames", type=int, default=0, metavar="N",
+                        help="Also write an N-frame animated GIF of the effect")
+    parser.add_argument("--scale", type=int, default=1, metavar="N",
+                        help="Output scale factor (default 1 = 1260x2736)")
+    parser.add_argument("--supersample", type=int, default=1, metavar="N",
+                        help="Render at N x the output scale and downsample (anti-aliasing)")
+    parser.add_argument("--band-height", type=int, default=256, metavar="PX",
+                        help="Scene rows per rendered band (default 256)")
+    parser.add_argument("--max-bands", type=int, default=4, metavar="N",
+                        help="Max bands in memory at once; caps peak memory (default 4)")
+    parser.add_argument("--workers", type=int, default=4, metavar="N",
+                        help="Render threads (default 4)")
+    parser.add_argument("--variants", type=str, metavar="JSON",
+                        help="Gameplay A/B variants: {name: {fuel_pct, vert_vel, horiz_vel, thrust_label}}")
+    args = parser.parse_args()
+    if args.variants and args.supersample > 1:
+        parser.error("--variants cannot be combined with --supersample")
+    render_opts = dict(scale=args.scale, supersample=args.supersample, band_height=args.band_height,
+                       max_bands=args.max_bands, workers=args.workers)
+
     output_dir = "../Screenshots"
     import os
     os.makedirs(output_dir, exist_ok=True)
 
-    print("Generating App Store screenshots (1260x2736)...")
+    print(f"Generating App Store screenshots ({WIDTH * args.scale}x{HEIGHT * args.scale})...")
 
     # Screenshot 1: Menu
     print("  Creating screenshot 1 (Menu)...")
-    img1 = create_screenshot_1_menu()
+    img1 = create_screenshot_1_menu(**render_opts)
     img1.save(f"{output_dir}/screenshot_1_menu.png", "PNG")
     print(f"  Saved: {output_dir}/screenshot_1_menu.png")
 
     # Screenshot 2: Gameplay
     print("  Creating screenshot 2 (Gameplay)...")
-    img2 = create_screenshot_2_gameplay()
+    img2 = create_screenshot_2_gameplay(**render_opts)
     img2.save(f"{output_dir}/screenshot_2_gameplay.png", "PNG")
     print(f"  Saved: {output_dir}/screenshot_2_gameplay.png")
 
+    if args.effect:
+        roi = default_effect_roi(args.effect, img2.width, img2.height)
+        fx_path = f"{output_dir}/screenshot_2_gameplay_{args.effect}.png"
+        apply_level_effect(img2, args.effect, roi).save(fx_path, "PNG")
+        print(f"  Saved: {fx_path}")
+        if args.frames > 0:
+            frames = list(render_effect_frames(img2, args.effect, args.frames, roi))
+            gif_path = f"{output_dir}/screenshot_2_gameplay_{args.effect}.gif"
+            frames[0].save(gif_path, save_all=True, append_images=frames[1:], duration=80, loop=0)
+            print(f"  Saved: {gif_path} ({args.frames} frames)")
+
+    if args.variants:
+        with open(args.variants, "r", encoding="utf-8") as f:
+            variants = json.load(f)
+        print(f"  Creating {len(variants)} gameplay variant(s)...")
+        start = time.perf_counter()
+        variant_opts = {k: v for k, v in render_opts.items() if k != "supersample"}
+        for name, img, boxes in render_variants(GAMEPLAY_LAYERS, variants, **variant_opts):
+            variant_path = f"{output_dir}/screenshot_2_gameplay_{name}.png"
+            img.save(variant_path, "PNG")
+            dirty_px = sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in boxes)
+            print(f"  Saved: {variant_path} ({len(boxes)} dirty box(es), {dirty_px} px)")
+        print(f"  Variants rendered and saved in {time.perf_counter() - start:.2f}s")
+
     # Screenshot 3: Game Over
     print("  Creating screenshot 3 (Game Over)...")
-    img3 = create_screenshot_3_gameover()
+    img3 = create_screenshot_3_gameover(**render_opts)
     img3.save(f"{output_dir}/screenshot_3_gameover.png", "PNG")
     print(f"  Saved: {output_dir}/screenshot_3_gameover.png")
 
@@ -0,0 +1,570 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo landability simulator for the Starship Lander campaign.
+
+Ports the lander's core per-frame physics from GameScene.swift and advances
+thousands of simulated landers at once as NumPy state arrays, each flown by a
+randomized pilot policy (reaction time, sink-rate schedule, target platform,
+tilt limits, aim error). Level parameters (gravity, thrustPower, special
+mechanic), landing thresholds and platform geometry are read from the Swift
+sources, so a rerun after retuning LevelDefinition.swift reflects the change.
+
+Reports per-level landing success rates, fuel-at-touchdown distributions,
+crash causes and the sensitivity of the success rate to each level parameter.
+Levels (and sensitivity variants) run as separate jobs on a process pool.
+
+The pilot policy is calibrated so that about half of the pilots land the
+Moon, which has no special mechanic; this is roughly a first-time player's
+rate. Half of the pilots head for the wide platform A (TARGET_SHARE).
+Pilots compensate for the forces they can feel. They lean into the Mars
+and Jupiter wind. They plan TURBULENCE_FORECAST seconds of the Venus updraft
+cycle into their braking. Levels that stay far below the Moon with these
+corrections (Mars, Venus, Jupiter) are hard because the mechanic outmatches
+an upright rocket near touchdown, not because the pilots ignore it.
+
+Usage:
+    python3 simulate_landings.py                     # All 10 levels, 4000 landers each
+    python3 simulate_landings.py --levels 6 10 -n 20000   # Venus and Jupiter, more landers
+    python3 simulate_landings.py --sensitivity       # Success-rate change per +/-10% of each parameter
+    python3 simulate_landings.py --save runs.npz     # Keep per-lander touchdown data
+"""
+
+import os
+import re
+import sys
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    print("Installing NumPy...")
+    import subprocess
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "numpy", "-q"])
+    import numpy as np
+
+SWIFT_DIR = Path(__file__).resolve().parent.parent / "RocketLander"
+
+# Screen in points (iPhone 15 / 16); the rocket starts at (0.15 W, H - 100)
+SCREEN = (393, 852)
+
+# SpriteKit: update() runs at 60 fps; physics uses 150 points per meter, so
+# gravity (m/s^2) and applyForce (N, on the 1.0 kg rocket) scale by 150.
+# Wind / gust / updraft strength hinges on the applyForce scale, which
+# --force-scale overrides to test how much of a level's difficulty it explains
+FPS = 60
+POINTS_PER_METER = 150.0
+MAX_SECONDS = 60
+
+# Mirrored from GameScene.swift / GameScene+Setup.swift
+ROCKET_HALF_WIDTH = 27.0      # 54 x 85 physics rectangle
+ROCKET_HALF_HEIGHT = 42.5
+ROTATION_POWER = 0.04         # angular velocity per frame while a button is held
+LATERAL_FACTOR = 0.15         # thrust vectoring
+ANGULAR_DAMPING = 0.7
+TITAN_DAMPING = 0.5           # denseAtmosphere linearDamping
+THRUST_FUEL = 0.3             # fuel % per thrusting frame
+ROTATE_FUEL = 0.08            # fuel % per frame per rotate button
+VELOCITY_HISTORY = 30         # frames averaged into approachSpeed
+TURBULENCE_FORECAST = 1.0     # seconds of the Venus updraft cycle pilots plan ahead for
+PLATFORM_TOP = 228.0          # platforms sit at y = 220 + 8 / 2, 8 pt tall
+GROUND_TOP = 10.0
+
+# Outcome codes
+RUNNING, LANDED, HARD_LANDING, MISSED, HAZARD, TIMEOUT = range(6)
+OUTCOME_NAMES = ("running", "landed", "hard landing", "missed platform", "hazard", "timeout")
+
+# Pilot policy parameters, drawn uniformly per lander
+PILOT_RANGES = {
+    "reaction": (4, 14),          # frames between control decisions
+    "tap": (1, 4),                # frames a rotate button is held per decision
+    "brake_margin": (1.2, 2.5),   # braking-distance safety factor (1 = last-moment burn)
+    "touchdown_sink": (10.0, 38.0),
+    "cruise": (25.0, 70.0),       # horizontal speed limit while translating
+    "tilt_limit": (0.12, 0.4),    # radians
+    "turn_deadband": (0.03, 0.06), # rotation error (after spin decays) tolerated before tapping
+    "settle_speed": (4.0, 15.0),  # horizontal speed accepted before leveling out over the pad
+    "level_out": (50.0, 160.0),   # altitude held until over the pad
+    "aim_error": (-18.0, 18.0),   # points from platform center
+}
+# Share of pilots heading for platform A / B / C (the nearest, widest pad is the usual pick)
+TARGET_SHARE = (0.5, 0.3, 0.2)
+
+# Parameters varied by --sensitivity; "hazard" scales the level's special mechanic
+# (wind/turbulence/gust force, Titan damping, Ganymede rock height, Io eruption rate)
+SENSITIVITY_PARAMS = ("gravity", "thrust_power", "hazard")
+SENSITIVITY_STEP = 0.10
+
+
+def load_levels(swift_dir: Path = SWIFT_DIR) -> list[dict]:
+    """Campaign levels from LevelDefinition.swift: id, name, gravity, thrust_power, mechanic."""
+    text = (swift_dir / "Models" / "LevelDefinition.swift").read_text()
+    pattern = re.compile(r'id: (\d+), name: "([^"]+)",\s*gravity: (-?[\d.]+), thrustPower: ([\d.]+),'
+                         r'.*?specialMechanic: \.(\w+)', re.S)
+    levels = [{"id": int(m[1]), "name": m[2], "gravity": float(m[3]), "thrust_power": float(m[4]),
+               "mechanic": m[5], "hazard": 1.0} for m in pattern.finditer(text)]
+    if not levels:
+        sys.exit(f"No levels found in {swift_dir / 'Models' / 'LevelDefinition.swift'}")
+    return levels
+
+
+def load_thresholds(swift_dir: Path = SWIFT_DIR) -> dict:
+    """GameScene.maxSafe* landing thresholds, e.g. {"maxSafeVerticalSpeed": 40.0, ...}."""
+    text = (swift_dir / "GameScene.swift").read_text()
+    return {m[1]: float(m[2]) for m in re.finditer(r"static let (maxSafe\w+): CGFloat = ([\d.]+)", text)}
+
+
+def load_platforms(swift_dir: Path = SWIFT_DIR) -> dict:
+    """LandingPlatform properties as arrays indexed A, B, C: width, x_fraction, multiplier, stars."""
+    text = (swift_dir / "Models" / "LandingPlatform.swift").read_text()
+
+    def cases(var):
+        body = re.search(r"var %s: \w+ \{(.*?)\n    \}" % var, text, re.S)[1]
+        return np.array([float(v) for v in re.findall(r"case \.\w: return ([\d.]+)", body)])
+
+    return {"width": cases("width"), "x_fraction": cases("xFraction"),
+            "multiplier": cases("multiplier"), "stars": cases("stars").astype(int)}
+
+
+def draw_pilots(rng, n: int) -> dict:
+    """Random pilot policies for n landers, plus each one's target platform."""
+    pilots = {name: rng.uniform(lo, hi, n) for name, (lo, hi) in PILOT_RANGES.items()}
+    lo, hi = PILOT_RANGES["reaction"]
+    pilots["reaction"] = rng.integers(lo, hi + 1, n)
+    pilots["phase"] = rng.integers(0, pilots["reaction"])
+    lo, hi = PILOT_RANGES["tap"]
+    pilots["tap"] = rng.integers(lo, hi + 1, n)
+    pilots["target"] = rng.choice(3, n, p=TARGET_SHARE)
+    return pilots
+
+
+def ganymede_obstacles(width: float, platforms: dict, hazard: float = 1.0) -> tuple:
+    """Ganymede terrain profile (x, height) and rock pillars (x, half_width, top).
+
+    hazard scales how far the rocks stand above the terrain.
+    """
+    terrain_x = np.array([0.0, 40.0, width - 50.0, width])
+    terrain_y = np.array([350.0, 150.0, 150.0, 350.0])
+    plat_x = platforms["x_fraction"] * width
+    half = platforms["width"] / 2
+    mid_bc = ((plat_x[1] + half[1]) + (plat_x[2] - half[2])) / 2
+    # Rocks sit on the terrain at y = 150; the jagged outline bulges to 1.1 x half width
+    rocks = np.array([[mid_bc, 9.0 * 1.1, 150.0 + 180.0 * hazard],
+                      [15.0, 12.5 * 1.1, 150.0 + 200.0 * hazard],
+                      [width - 18.0, 11.0 * 1.1, 150.0 + 190.0 * hazard]])
+    return terrain_x, terrain_y, rocks
+
+
+def simulate(level: dict, n: int = 4000, seed: int = 0, screen: tuple = SCREEN,
+             thresholds: dict = None, platforms: dict = None, max_seconds: float = MAX_SECONDS,
+             force_scale: float = POINTS_PER_METER) -> dict:
+    """Fly n randomized pilots through one level; returns per-lander outcome arrays.
+
+    All state lives in arrays of the still-flying landers (compacted as they
+    finish), so each frame is a few dozen vectorized operations whatever n
+    is. Results: outcome, platform (-1 if none), fuel, time, and the
+    touchdown values calculateScore() takes (vertical, horizontal, rotation,
+    approach, offset from the platform's nominal center).
+    """
+    thresholds = thresholds or load_thresholds()
+    platforms = platforms or load_platforms()
+    rng = np.random.default_rng(seed)
+    width, height = screen
+    dt = 1.0 / FPS
+    mechanic = level["mechanic"]
+    hazard = level["hazard"]
+    gravity = level["gravity"] * POINTS_PER_METER * dt
+    thrust_power = level["thrust_power"]
+    damping = 1.0 / (1.0 + dt * (TITAN_DAMPING * hazard if mechanic == "denseAtmosphere" else 0.0))
+    spin_damping = 1.0 / (1.0 + dt * ANGULAR_DAMPING)
+    force_scale = force_scale * dt * hazard
+    # Net upward acceleration at full thrust (pt/s^2) before mechanic forces
+    brake = thrust_power * FPS + level["gravity"] * POINTS_PER_METER
+
+    plat_x0 = platforms["x_fraction"] * width
+    plat_half = platforms["width"] / 2
+    plat_x = plat_x0.copy()
+    plat_dy = np.zeros(3)
+    plat_dir = np.ones(3)
+
+    s = draw_pilots(rng, n)
+    s["index"] = np.arange(n)
+    s["x"] = np.full(n, 0.15 * width)
+    s["y"] = np.full(n, height - 100.0)
+    for name in ("vx", "vy", "rot", "spin"):
+        s[name] = np.zeros(n)
+    s["fuel"] = np.full(n, 100.0)
+    for name in ("thrust", "left", "right"):
+        s[name] = np.zeros(n, dtype=bool)
+    s["history"] = np.zeros((n, VELOCITY_HISTORY))
+    # Mechanic force felt last frame (velocity change per frame), which pilots compensate for
+    s["ext_vx"] = np.zeros(n)
+    s["ext_vy"] = np.zeros(n)
+    if mechanic == "lightWind":
+        s["wind"] = rng.uniform(-1.5, 1.5, n)
+    elif mechanic == "extremeWind":
+        s["gust_active"] = np.zeros(n, dtype=bool)
+        s["gust_timer"] = np.zeros(n)
+        s["gust_dir"] = np.ones(n)
+        s["gust_calm"] = np.full(n, 3.0)
+        s["gust_length"] = np.full(n, 2.0)
+    elif mechanic == "movingPlatform":
+        s["bob_phase"] = rng.uniform(0, 2 * np.pi / 1.2, n)
+    elif mechanic == "volcanicEruptions":
+        # SKAction.wait(forDuration: .random(in: 2...5)) is drawn once, then repeated
+        s["erupt_period"] = rng.uniform(2.0, 5.0, n) / hazard
+        s["erupt_next"] = s["erupt_period"].copy()
+        s["erupt_start"] = np.full(n, -np.inf)
+        s["erupt_x"] = np.zeros(n)
+        for name in ("debris_dx", "debris_dy", "debris_time", "debris_r"):
+            s[name] = np.zeros((n, 8))
+    if mechanic == "deepCraters":
+        terrain_x, terrain_y, rocks = ganymede_obstacles(width, platforms, hazard)
+
+    result = {name: np.full(n, np.nan) for name in
+              ("fuel", "time", "vertical", "horizontal", "rotation", "approach", "offset")}
+    result["outcome"] = np.full(n, RUNNING, dtype=np.int8)
+    result["platform"] = np.full(n, -1, dtype=np.int8)
+
+    def finish(done, code, frame, platform=None):
+        """Record outcome for the landers in boolean mask done (current frame)."""
+        idx = s["index"][done]
+        result["outcome"][idx] = code
+        result["fuel"][idx] = s["fuel"][done]
+        result["time"][idx] = frame * dt
+        if platform is not None:
+            result["platform"][idx] = platform[done]
+
+    frames = int(max_seconds * FPS)
+    forecast = np.arange(0.0, TURBULENCE_FORECAST, dt)
+    for frame in range(frames):
+        t = frame * dt
+        count = len(s["x"])
+        if count == 0:
+            break
+        rows = np.arange(count)
+
+        # Velocity tracking (top of update): last 30 frames of descent speed
+        s["history"][:, frame % VELOCITY_HISTORY] = np.maximum(0.0, -s["vy"])
+
+        # Moving barge (Earth): positions are shared, platform C's bob follows wall time
+        if mechanic == "movingPlatform":
+            speed = np.array([12.0, 25.0, 30.0]) * hazard * dt
+            plat_dy[0] += plat_dir[0] * speed[0]
+            if abs(plat_dy[0]) > 15:
+                plat_dir[0] *= -1
+            plat_x[1] += plat_dir[1] * speed[1]
+            if abs(plat_x[1] - plat_x0[1]) > 30:
+                plat_dir[1] *= -1
+            plat_x[1] = max(plat_x[0] + plat_half[0] + plat_half[1] + 10,
+                            min(plat_x[2] - plat_half[2] - plat_half[1] - 10, plat_x[1]))
+            plat_x[2] += plat_dir[2] * speed[2]
+            if abs(plat_x[2] - plat_x0[2]) > 20:
+                plat_dir[2] *= -1
+            plat_x[2] = max(plat_x[1] + plat_half[1] + plat_half[2] + 10, plat_x[2])
+            tops = np.tile(PLATFORM_TOP + plat_dy, (count, 1))
+            tops[:, 2] = PLATFORM_TOP + np.sin((t + s["bob_phase"]) * 1.2) * 15
+        else:
+            tops = np.full((count, 3), PLATFORM_TOP)
+
+        # Pilots learn the Venus rhythm: braking authority is judged against the strongest
+        # downdraft due within the forecast, and sink that full thrust could not brake away
+        # through it is shed beforehand (climbing if need be)
+        if mechanic == "heavyTurbulence":
+            updraft = np.sin((t + forecast) * 1.5) * 4.0 * force_scale
+            braking = max(brake + updraft.min() * FPS, 1.0)
+            shortfall = np.maximum(0.0, -(thrust_power + gravity + updraft)).sum()
+        else:
+            braking = brake
+            shortfall = 0.0
+
+        # Pilot decisions, every `reaction` frames per lander
+        decide = (frame % s["reaction"]) == s["phase"]
+        target = s["target"]
+        target_x = plat_x[target] + s["aim_error"]
+        altitude = s["y"] - ROCKET_HALF_HEIGHT - tops[rows, target]
+        dx = target_x - s["x"]
+        # Translate while descending; below level_out hold altitude until over the pad, and level
+        # out once slow there (or regardless, halfway down)
+        low = altitude < s["level_out"]
+        over_pad = np.abs(dx) < plat_half[target] / 2
+        settled = over_pad & (np.abs(s["vx"]) < s["settle_speed"])
+        want_vx = np.clip(dx * 0.3, -s["cruise"], s["cruise"])
+        # Lean into a steady push: while hovering, thrust averages -gravity per frame
+        lean = s["ext_vx"] / (-gravity * (1 - LATERAL_FACTOR))
+        want_rot = np.clip(lean - (want_vx - s["vx"]) * 0.005, -s["tilt_limit"], s["tilt_limit"])
+        want_rot = np.where(low & (settled | (over_pad & (altitude < s["level_out"] / 2))), 0.0, want_rot)
+        # Aim where the rocket will settle once its spin has decayed, not where it is now
+        turn = want_rot - (s["rot"] + s["spin"] / ANGULAR_DAMPING)
+        # Sink rate from which full thrust still brakes to touchdown_sink within altitude / margin,
+        # judged at the altitude the lander will have reached by the next decision
+        ahead = altitude + s["vy"] * s["reaction"] * dt
+        want_sink = np.sqrt(s["touchdown_sink"] ** 2 + 2 * braking * np.maximum(ahead, 0) / s["brake_margin"])
+        holding = low & ~over_pad
+        want_sink = np.where(holding, 0.0, want_sink)
+        want_sink = want_sink - shortfall
+        # Braking: fire if coasting until the next decision would overshoot want_sink.
+        # Holding: fire if that keeps the mean sink closer to want_sink than coasting would
+        # (a one-sided threshold there would climb on every burst)
+        coast_sink = -s["vy"] - (gravity + s["ext_vy"]) * s["reaction"]
+        error = s["vy"] + want_sink + s["ext_vy"] * s["reaction"] / 2
+        fire = np.where(holding, error < -(thrust_power + 2 * gravity) * s["reaction"] / 4, coast_sink > want_sink)
+        s["thrust"] = np.where(decide, fire, s["thrust"])
+        s["left"] = np.where(decide, turn > s["turn_deadband"], s["left"])
+        s["right"] = np.where(decide, turn < -s["turn_deadband"], s["right"])
+
+        # Main thrust (velocity += per-frame thrust along the nose, plus vectoring)
+        firing = s["thrust"] & (s["fuel"] > 0)
+        angle = s["rot"] + np.pi / 2
+        s["vx"] += firing * (np.cos(angle) * thrust_power + np.sin(s["rot"]) * thrust_power * LATERAL_FACTOR)
+        s["vy"] += firing * np.sin(angle) * thrust_power
+        fuel_used = firing * THRUST_FUEL
+
+        # Rotation buttons, tapped for the first `tap` frames after a decision
+        pressing = (s["fuel"] > 0) & ((frame - s["phase"]) % s["reaction"] < s["tap"])
+        left = pressing & s["left"]
+        right = pressing & s["right"]
+        s["spin"] += ROTATION_POWER * (left.astype(float) - right)
+        fuel_used = fuel_used + ROTATE_FUEL * (left.astype(float) + right)
+        s["fuel"] = np.maximum(0.0, s["fuel"] - fuel_used)
+
+        # Special mechanics (applyCampaignMechanics)
+        if mechanic == "lightWind":
+            s["ext_vx"] = s["wind"] * force_scale
+            s["vx"] += s["ext_vx"]
+        elif mechanic == "heavyTurbulence":
+            s["ext_vy"] = (np.sin(t * 1.5) * 4.0 + rng.uniform(-0.5, 0.5, count)) * force_scale
+            s["vy"] += s["ext_vy"]
+        elif mechanic == "extremeWind":
+            s["gust_timer"] += dt
+            active = s["gust_active"]
+            gust = np.where(active, 15.0 * s["gust_dir"] + rng.uniform(-2, 2, count), rng.uniform(-1, 1, count))
+            s["ext_vx"] = gust * force_scale
+            s["vx"] += s["ext_vx"]
+            ending = active & (s["gust_timer"] >= s["gust_length"])
+            starting = ~active & (s["gust_timer"] >= s["gust_calm"])
+            s["gust_calm"] = np.where(ending, rng.uniform(2.5, 4.0, count), s["gust_calm"])
+            s["gust_length"] = np.where(starting, rng.uniform(1.5, 2.5, count), s["gust_length"])
+            s["gust_dir"] = np.where(starting, rng.choice([-1.0, 1.0], count), s["gust_dir"])
+            s["gust_active"] = active ^ (ending | starting)
+            s["gust_timer"] = np.where(ending | starting, 0.0, s["gust_timer"])
+        elif mechanic == "heatShimmer":
+            s["vx"] += firing * rng.uniform(-1.5, 1.5, count) * hazard
+            s["vy"] += firing * rng.uniform(-0.8, 0.8, count) * hazard
+
+        # Physics step: gravity, damping, integration
+        s["vy"] += gravity
+        s["vx"] *= damping
+        s["vy"] *= damping
+        s["spin"] *= spin_damping
+        previous_bottom = s["y"] - ROCKET_HALF_HEIGHT
+        s["x"] += s["vx"] * dt
+        s["y"] += s["vy"] * dt
+        s["rot"] += s["spin"] * dt
+        bottom = s["y"] - ROCKET_HALF_HEIGHT
+
+        # Platform contact: the bottom crosses a platform top within its span
+        over = np.abs(s["x"][:, None] - plat_x[None, :]) <= plat_half + ROCKET_HALF_WIDTH
+        crossing = over & (previous_bottom[:, None] > tops) & (bottom[:, None] <= tops)
+        touched = crossing.any(axis=1)
+        landed_on = np.where(touched, crossing.argmax(axis=1), -1)
+
+        alive = np.ones(count, dtype=bool)
+        if touched.any():
+            vertical = np.maximum(0.0, -s["vy"])
+            horizontal = np.abs(s["vx"])
+            rotation = np.abs(s["rot"])
+            approach = s["history"][:, :min(frame + 1, VELOCITY_HISTORY)].mean(axis=1)
+            safe = ((vertical <= thresholds["maxSafeVerticalSpeed"])
+                    & (horizontal <= thresholds["maxSafeHorizontalSpeed"])
+                    & (rotation <= thresholds["maxSafeRotation"])
+                    & (approach <= thresholds["maxSafeApproachSpeed"]))
+            idx = s["index"][touched]
+            result["vertical"][idx] = vertical[touched]
+            result["horizontal"][idx] = horizontal[touched]
+            result["rotation"][idx] = rotation[touched]
+            result["approach"][idx] = approach[touched]
+            result["offset"][idx] = np.abs(s["x"] - plat_x0[np.maximum(landed_on, 0)])[touched]
+            finish(touched & safe, LANDED, frame, landed_on)
+            finish(touched & ~safe, HARD_LANDING, frame, landed_on)
+            alive &= ~touched
+
+        # Hazards
+        if mechanic == "deepCraters":
+            floor = np.interp(s["x"], terrain_x, terrain_y)
+            rock_hit = ((np.abs(s["x"][:, None] - rocks[:, 0]) <= rocks[:, 1] + ROCKET_HALF_WIDTH)
+                        & (bottom[:, None] <= rocks[:, 2])).any(axis=1)
+            hit = alive & rock_hit
+            finish(hit, HAZARD, frame)
+            alive &= ~hit
+        else:
+            floor = GROUND_TOP
+        if mechanic == "volcanicEruptions":
+            erupting = s["erupt_next"] <= t
+            if erupting.any():
+                k = int(erupting.sum())
+                s["erupt_start"][erupting] = t
+                s["erupt_next"][erupting] += s["erupt_period"][erupting]
+                s["erupt_x"][erupting] = rng.uniform(50, width - 50, k)
+                s["debris_dx"][erupting] = rng.uniform(-40, 40, (k, 8))
+                s["debris_dy"][erupting] = rng.uniform(80, 200, (k, 8))
+                s["debris_time"][erupting] = rng.uniform(0.6, 1.2, (k, 8))
+                s["debris_r"][erupting] = rng.uniform(3, 7, (k, 8))
+            # Debris is deadly while rising (physics removed when the move ends)
+            age = (t - s["erupt_start"])[:, None]
+            rising = age < s["debris_time"]
+            progress = np.minimum(age / s["debris_time"], 1.0)
+            px = s["erupt_x"][:, None] + s["debris_dx"] * progress
+            py = 180.0 + s["debris_dy"] * progress
+            gap_x = np.maximum(np.abs(px - s["x"][:, None]) - ROCKET_HALF_WIDTH, 0.0)
+            gap_y = np.maximum(np.abs(py - s["y"][:, None]) - ROCKET_HALF_HEIGHT, 0.0)
+            hit = alive & (rising & (gap_x ** 2 + gap_y ** 2 <= s["debris_r"] ** 2)).any(axis=1)
+            finish(hit, HAZARD, frame)
+            alive &= ~hit
+
+        missed = alive & ((bottom <= floor) | (s["y"] < -100))
+        finish(missed, MISSED, frame)
+        alive &= ~missed
+
+        # Screen wrap
+        s["x"] = np.where(s["x"] < -20, width + 20, np.where(s["x"] > width + 20, -20, s["x"]))
+
+        if not alive.all():
+            s = {name: value[alive] for name, value in s.items()}
+
+    if len(s["x"]):
+        finish(np.ones(len(s["x"]), dtype=bool), TIMEOUT, frames)
+    return result
+
+
+def summarize(level: dict, result: dict) -> dict:
+    """Success rate with a 95% interval, fuel-at-touchdown percentiles, outcome and platform shares."""
+    outcome = result["outcome"]
+    n = len(outcome)
+    landed = outcome == LANDED
+    rate = landed.mean()
+    fuel = result["fuel"][landed]
+    return {
+        "level": level,
+        "n": n,
+        "success": rate,
+        "margin": 1.96 * np.sqrt(rate * (1 - rate) / n),
+        "fuel": np.percentile(fuel, [10, 50, 90]) if len(fuel) else np.full(3, np.nan),
+        "outcomes": np.bincount(outcome, minlength=len(OUTCOME_NAMES)) / n,
+        "platforms": np.bincount(result["platform"][landed], minlength=3) / max(1, landed.sum()),
+    }
+
+
+def run_job(job: tuple) -> tuple:
+    """Process-pool entry point: (key, level, n, seed, screen, force_scale) -> (key, summary, result)."""
+    key, level, n, seed, screen, force_scale = job
+    result = simulate(level, n, seed, screen, force_scale=force_scale)
+    return key, summarize(level, result), result
+
+
+def sweep(levels: list[dict], n: int, seed: int, screen: tuple, jobs: int, sensitivity: bool,
+          force_scale: float = POINTS_PER_METER) -> dict:
+    """Simulate each level (and its +/- SENSITIVITY_STEP variants) on a process pool.
+
+    Variants reuse the base seed (common random numbers): the same pilots
+    fly each variant, so differences reflect the parameter, not sampling.
+    Returns {(level_id, param, sign): (summary, result)}; the base run is (id, None, 0).
+    """
+    work = []
+    for level in levels:
+        work.append(((level["id"], None, 0), level, n, seed + level["id"], screen, force_scale))
+        if sensitivity:
+            for param in SENSITIVITY_PARAMS:
+                if param == "hazard" and level["mechanic"] in ("none", "iceSurface"):
+                    continue
+                for sign in (-1, 1):
+                    variant = dict(level, **{param: level[param] * (1 + sign * SENSITIVITY_STEP)})
+                    work.append(((level["id"], param, sign), variant, n, seed + level["id"], screen, force_scale))
+
+    if jobs > 1 and len(work) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(work))) as pool:
+            done = list(pool.map(run_job, work, chunksize=1))
+    else:
+        done = [run_job(job) for job in work]
+    return {key: (summary, result) for key, summary, result in done}
+
+
+def print_report(levels: list[dict], runs: dict, sensitivity: bool):
+    print(f"{'Level':<12} {'g':>5} {'thrust':>6}  {'Success':>14}  {'Fuel p10/p50/p90':>17}  "
+          f"{'A/B/C share':>14}  Crashes (hard / missed / hazard / timeout)")
+    print("-" * 118)
+    for level in levels:
+        summary, _ = runs[(level["id"], None, 0)]
+        p10, p50, p90 = summary["fuel"]
+        shares = "/".join(f"{share * 100:.0f}" for share in summary["platforms"])
+        crashes = " / ".join(f"{share * 100:4.1f}%" for share in summary["outcomes"][HARD_LANDING:])
+        print(f"{level['id']:>2} {level['name']:<9} {level['gravity']:>5.1f} {level['thrust_power']:>6.1f}  "
+              f"{summary['success'] * 100:6.1f}% ±{summary['margin'] * 100:4.1f}  "
+              f"{p10:5.1f} {p50:5.1f} {p90:5.1f}  {shares:>14}  {crashes}")
+
+    if not sensitivity:
+        return
+    print(f"\nSuccess-rate change (percentage points) for +{SENSITIVITY_STEP:.0%} of each parameter "
+          f"(central difference, same pilots)")
+    print(f"{'Level':<12} " + " ".join(f"{param:>13}" for param in SENSITIVITY_PARAMS))
+    for level in levels:
+        cells = []
+        for param in SENSITIVITY_PARAMS:
+            if (level["id"], param, 1) not in runs:
+                cells.append(f"{'-':>13}")
+                continue
+            up = runs[(level["id"], param, 1)][0]["success"]
+            down = runs[(level["id"], param, -1)][0]["success"]
+            cells.append(f"{(up - down) / 2 * 100:>+13.1f}")
+        print(f"{level['id']:>2} {level['name']:<9} " + " ".join(cells))
+
+
+def save_runs(path: Path, levels: list[dict], runs: dict):
+    """Per-lander base-run arrays as <field>_<level id> in an .npz."""
+    arrays = {}
+    for level in levels:
+        _, result = runs[(level["id"], None, 0)]
+        for name, values in result.items():
+            arrays[f"{name}_{level['id']}"] = values
+    np.savez_compressed(path, **arrays)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo landability simulator for campaign levels")
+    parser.add_argument("--levels", type=int, nargs="+", metavar="ID", help="Level IDs to simulate (default: all)")
+    parser.add_argument("-n", "--landers", type=int, default=4000, metavar="N", help="Landers per level (default: 4000)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--screen", type=str, default=f"{SCREEN[0]}x{SCREEN[1]}", metavar="WxH",
+                        help=f"Screen size in points (default: {SCREEN[0]}x{SCREEN[1]})")
+    parser.add_argument("--sensitivity", action="store_true",
+                        help=f"Also rerun each level with gravity, thrust and hazard strength at ±{SENSITIVITY_STEP:.0%}")
+    parser.add_argument("--force-scale", type=float, default=POINTS_PER_METER, metavar="K",
+                        help=f"Points/s^2 per newton for wind, gusts and turbulence (default: {POINTS_PER_METER:g})")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, metavar="N",
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--save", type=str, metavar="FILE", help="Write per-lander touchdown data (.npz)")
+    args = parser.parse_args()
+
+    levels = load_levels()
+    if args.levels:
+        levels = [level for level in levels if level["id"] in args.levels]
+        if not levels:
+            parser.error("no matching level IDs")
+    screen = tuple(float(v) for v in args.screen.lower().split("x"))
+
+    start = time.perf_counter()
+    runs = sweep(levels, args.landers, args.seed, screen, args.jobs, args.sensitivity, args.force_scale)
+    elapsed = time.perf_counter() - start
+
+    print_report(levels, runs, args.sensitivity)
+    landers = len(runs) * args.landers
+    print(f"\n{landers:,} simulated landings ({len(runs)} runs) in {elapsed:.1f}s on {min(args.jobs, len(runs))} process(es)")
+    if args.save:
+        save_runs(Path(args.save), levels, runs)
+        print(f"Saved per-lander data to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Batch captioning with --auto placement on reference-size screenshots."""
+
+import os
+import sys
+import json
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import caption_screenshots  # noqa: E402
+
+
+def make_screenshot(path, size=caption_screenshots.REFERENCE_SIZE):
+    """Dark sky with a busy striped band where the first UI row would be"""
+    pixels = np.full((size[1], size[0], 4), (10, 12, 30, 255), dtype=np.uint8)
+    band = slice(size[1] // 5, size[1] // 5 + 120)
+    pixels[band, ::8] = (240, 240, 240, 255)
+    Image.fromarray(pixels, 'RGBA').save(path)
+
+
+def test_batch_auto_on_reference_size(tmp_path):
+    device_dir = tmp_path / 'iphone'
+    device_dir.mkdir()
+    make_screenshot(device_dir / '01_main_menu.png')
+    locales_dir = tmp_path / 'captions'
+    locales_dir.mkdir()
+    for locale in ('en-US', 'de-DE'):
+        (locales_dir / f'{locale}.json').write_text(
+            json.dumps({'01_main_menu.png': {'line1': 'LAND ON', 'line2': 'TEN WORLDS'}}))
+    output_root = tmp_path / 'out'
+
+    images = caption_screenshots.run_batch(str(locales_dir), [str(device_dir)], str(output_root),
+                                           jobs=1, auto=True)
+
+    assert images == 2
+    for locale in ('en-US', 'de-DE'):
+        with Image.open(output_root / 'iphone' / locale / '01_main_menu_captioned.png') as img:
+            assert img.size == caption_screenshots.REFERENCE_SIZE
@@ -0,0 +1,28 @@
+"""Redaction of secrets that a tool-call summary truncates."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import export_chat_transcripts as export  # noqa: E402
+
+TOKEN = 'ghp_' + 'B' * 40
+
+
+def test_bash_summary_never_splits_a_secret():
+    command = 'x' * 105 + ' ' + TOKEN + ' && echo done'
+    summary = export.format_tool_call('Bash', {'command': command})
+    redacted = export.Redactor()(summary)
+
+    assert 'ghp_' not in redacted
+    assert 'BBBB' not in redacted
+    assert redacted.endswith('...`*')
+
+
+def test_bash_summary_keeps_secret_before_the_cut_whole():
+    command = 'curl -H ' + TOKEN + ' ' + 'y' * 150
+    redacted = export.Redactor()(export.format_tool_call('Bash', {'command': command}))
+
+    assert export.REDACTED in redacted
+    assert 'BBBB' not in redacted